@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+
+from domain.entities.learning import LearningPlan, StudySession
+from domain.entities.question import Question, SessionQuestion
+from domain.ports.learning_plan_repository import LearningPlanRepository
+from domain.ports.question_repository import QuestionRepository
+
+
+@dataclass
+class UnitOfWork:
+    """
+    Collects dirty entities during a use case and persists them in one flush.
+
+    Registering the same entity several times results in a single write, so
+    use cases can mark aggregates dirty as they go and pay the persistence
+    cost once at ``commit`` time instead of issuing one round-trip per
+    ``save`` call.
+    """
+
+    learning_plan_repository: LearningPlanRepository | None = None
+    question_repository: QuestionRepository | None = None
+
+    _dirty_questions: dict[str, Question] = field(default_factory=dict)
+    _dirty_plans: dict[str, LearningPlan] = field(default_factory=dict)
+    _dirty_sessions: dict[str, tuple[str, StudySession]] = field(
+        default_factory=dict
+    )
+    _dirty_session_questions: dict[str, tuple[str, str, SessionQuestion]] = field(
+        default_factory=dict
+    )
+
+    def register_question(self, question: Question) -> None:
+        """Mark a question as dirty, to be written on commit."""
+        self._dirty_questions[question.id] = question
+
+    def register_learning_plan(self, plan: LearningPlan) -> None:
+        """Mark a learning plan aggregate as dirty, to be written on commit."""
+        self._dirty_plans[plan.id] = plan
+
+    def register_session(self, plan_id: str, session: StudySession) -> None:
+        """Mark a single session as dirty, avoiding a full aggregate write."""
+        self._dirty_sessions[session.id] = (plan_id, session)
+
+    def register_session_question(
+        self, plan_id: str, session_id: str, session_question: SessionQuestion
+    ) -> None:
+        """Mark a single session question as dirty — the smallest write unit."""
+        self._dirty_session_questions[session_question.question_id] = (
+            plan_id,
+            session_id,
+            session_question,
+        )
+
+    def commit(self) -> None:
+        """Flush every dirty entity to its repository in one batch."""
+        for question in self._dirty_questions.values():
+            self.question_repository.save(question)
+        self._dirty_questions.clear()
+
+        for plan_id, session_id, sq in self._dirty_session_questions.values():
+            self.learning_plan_repository.save_session_question(
+                plan_id, session_id, sq
+            )
+        self._dirty_session_questions.clear()
+
+        for plan_id, session in self._dirty_sessions.values():
+            self.learning_plan_repository.save_session(plan_id, session)
+        self._dirty_sessions.clear()
+
+        for plan in self._dirty_plans.values():
+            self.learning_plan_repository.save(plan)
+        self._dirty_plans.clear()
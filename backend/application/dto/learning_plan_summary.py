@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class StudySessionSummary:
+    """Card-sized projection of an in-progress StudySession."""
+    session_id: str
+    questions_answered: int
+    total_questions: int
+    max_questions: int
+    started_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class LearningPlanSummary:
+    """Card-sized projection of a LearningPlan for list/dashboard views.
+
+    Carries only the fields the plan cards render, so listing plans never
+    has to ship full aggregates (sessions, attempts, question payloads)
+    to the API layer.
+    """
+    learning_plan_id: str
+    knowledge_unit_count: int
+    average_mastery: float
+    created_at: datetime
+    completed_at: datetime | None
+    session_count: int
+    incomplete_sessions: list[StudySessionSummary]
@@ -1,17 +1,30 @@
 from dataclasses import dataclass
-from enum import Enum
 
-from domain.entities.question import QuestionStatus, QuestionID, Answer
+from domain.entities.question import QuestionID, Answer
 from domain.entities.knowledge_unit import KnowledgeUnitID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuestionView:
     id: QuestionID
     knowledge_unit_id: KnowledgeUnitID
     text: str
-    status: QuestionStatus
+    # Plain interned status string ("pending"/"correct"/"incorrect"): views
+    # serialize it directly without the Enum .value dispatch per question.
+    status: str
     difficulty: int
     attempts: int
     correct_answer: Answer | None = None
     user_answer: str | None = None  # The user's last submitted answer
+
+
+@dataclass(frozen=True, slots=True)
+class QuestionProgressView:
+    """Lightweight per-question view for progress polling.
+
+    Omits the heavy payload fields (question text, answers) so building it
+    never needs the question repository.
+    """
+    id: QuestionID
+    status: str
+    attempts: int
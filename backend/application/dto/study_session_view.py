@@ -1,11 +1,20 @@
 from dataclasses import dataclass
 
-from application.dto.question_view import QuestionView
+from application.dto.question_view import QuestionView, QuestionProgressView
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StudySessionView:
     id: str
     progress: float
     questions: list[QuestionView]
     is_completed: bool
+
+
+@dataclass(frozen=True, slots=True)
+class StudySessionProgressView:
+    """Progress-only counterpart of StudySessionView for polling clients."""
+    id: str
+    progress: float
+    questions: list[QuestionProgressView]
+    is_completed: bool
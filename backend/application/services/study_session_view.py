@@ -1,40 +1,114 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from domain.entities.learning import StudySession
-from domain.entities.question import Question, SessionQuestion, QuestionStatus
-from application.dto.study_session_view import StudySessionView
-from application.dto.question_view import QuestionView
+from domain.entities.question import Question, QuestionStatus
+from application.dto.study_session_view import (
+    StudySessionView,
+    StudySessionProgressView,
+)
+from application.dto.question_view import QuestionView, QuestionProgressView
 from domain.ports.question_repository import QuestionRepository
 
 
+# Status strings precomputed once: views carry the plain value and the
+# serializer never pays the Enum .value dispatch per question.
+_STATUS_STR = {member: member.value for member in QuestionStatus}
+
+# Specialized QuestionView builder generated once at import time. The exec'd
+# source inlines every field access, so the hot view-building loop runs one
+# call per question instead of generic per-field iteration.
+_MAKE_VIEW_SRC = """\
+def _make_view(question, session_question):
+    return QuestionView(
+        id=question.id,
+        knowledge_unit_id=question.knowledge_unit_id,
+        text=question.text,
+        status=_STATUS_STR[session_question.status],
+        attempts=len(session_question.attempts),
+        correct_answer=question.correct_answer,
+        difficulty=question.difficulty.level,
+        user_answer=session_question.attempts[-1] if session_question.attempts else None,
+    )
+"""
+_namespace: dict = {"QuestionView": QuestionView, "_STATUS_STR": _STATUS_STR}
+exec(_MAKE_VIEW_SRC, _namespace)
+_make_view = _namespace["_make_view"]
+
+_VIEW_CACHE_MAX_SIZE = 4096
+
+
 @dataclass
 class StudySessionViewService:
     question_repository: QuestionRepository
+    # Memoized views keyed by (question_id, attempts, status). The DTO is
+    # frozen, so sharing instances across polls of an unchanged question is
+    # safe and skips the reconstruction entirely.
+    _view_cache: dict[tuple, QuestionView] = field(default_factory=dict)
+
+    def _view_for(self, question: Question, session_question) -> QuestionView:
+        key = (question.id, len(session_question.attempts), session_question.status)
+        view = self._view_cache.get(key)
+        if view is None:
+            view = _make_view(question, session_question)
+            if len(self._view_cache) >= _VIEW_CACHE_MAX_SIZE:
+                # Drop the oldest entry to keep the cache bounded
+                self._view_cache.pop(next(iter(self._view_cache)))
+            self._view_cache[key] = view
+        return view
 
     def build_view(self, session: StudySession) -> StudySessionView:
-        question_ids = [q_id for q_id in session.questions.keys()]
-        session_questions: list[SessionQuestion] = list(session.questions.values())
-        questions: list[Question] = [
-            self.question_repository.get_by_id(q_id)
-            for q_id in question_ids
-        ]
+        # Single batched fetch instead of one round-trip per question
+        questions_by_id: dict[str, Question] = self.question_repository.get_many(
+            list(session.questions)
+        )
+        return self._assemble_view(session, questions_by_id)
+
+    async def build_view_async(self, session: StudySession) -> StudySessionView:
+        """Async variant that awaits the batched fetch before assembling."""
+        questions_by_id = await self.question_repository.get_many_async(
+            list(session.questions)
+        )
+        return self._assemble_view(session, questions_by_id)
+
+    def build_progress_view(self, session: StudySession) -> StudySessionProgressView:
+        """
+        Build a progress-only view from session state alone.
 
+        Skips the question repository fetch entirely — status and attempt
+        counts live on the SessionQuestions, so polling clients that only
+        care about progress never pay for the question payloads.
+        """
         question_views = [
-            QuestionView(
-                id=question.id,
-                knowledge_unit_id=question.knowledge_unit_id,
-                text=question.text,
-                status=session_question.status,
-                attempts=len(session_question.attempts),
-                correct_answer=question.correct_answer,
-                difficulty=question.difficulty.level,
-                user_answer=session_question.attempts[-1] if session_question.attempts else None,
+            QuestionProgressView(
+                id=sq.question_id,
+                status=_STATUS_STR[sq.status],
+                attempts=len(sq.attempts),
             )
-            for session_question, question in zip(session_questions, questions)
+            for sq in session.questions.values()
         ]
 
-        completed = sum(q.status != QuestionStatus.PENDING for q in question_views)
-        total = len(question_views)
+        total = len(session.questions)
+        return StudySessionProgressView(
+            id=session.id,
+            progress=session.completed_count / total if total else 0.0,
+            questions=question_views,
+            is_completed=session.is_completed(),
+        )
+
+    def _assemble_view(
+        self,
+        session: StudySession,
+        questions_by_id: dict[str, Question],
+    ) -> StudySessionView:
+        # Hoist the method lookup out of the per-question loop
+        _view_for = self._view_for
+        question_views = [
+            _view_for(questions_by_id[q_id], session_question)
+            for q_id, session_question in session.questions.items()
+        ]
+
+        completed = session.completed_count
+        total = len(session.questions)
 
         return StudySessionView(
             id=session.id,
@@ -42,11 +116,3 @@ class StudySessionViewService:
             questions=question_views,
             is_completed=session.is_completed(),
         )
-
-    # @staticmethod
-    # def _status(q: SessionQuestion) -> QuestionStatus:
-    #     if len(q.attempts) == 0 or q.is_correct is None:
-    #         return QuestionStatus.PENDING
-    #     if q.is_correct:
-    #         return QuestionStatus.CORRECT
-    #     return QuestionStatus.INCORRECT
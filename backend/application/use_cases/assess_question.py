@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
 
@@ -15,7 +16,14 @@ from application.common.exceptions import (
     QuestionNotInStudySessionException,
     NoUnassessedAnswerAttemptException,
 )
+from application.common.unit_of_work import UnitOfWork
 
+logger = logging.getLogger(__name__)
+
+
+# Shared pool for overlapping the independent repository fetches; sized small
+# since each request only ever submits two lookups.
+_fetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="assess-io")
 
 
 @dataclass
@@ -35,19 +43,25 @@ class AssessQuestionOutcomeUseCase:
         study_session_id: StudySessionID,
         question_id: QuestionID,
     ) -> AnswerAssessment:
-        logging.info("[AssessQuestionOutcomeUseCase] Assessing question outcome.")
+        logger.debug("[AssessQuestionOutcomeUseCase] Assessing question outcome.")
 
-        # 1. Load aggregate root
-        learning_plan = self.learning_plan_repository.get_by_id(learning_plan_id)
-        if not learning_plan:
-            raise LearningPlanNotFoundException(learning_plan_id=learning_plan_id)
-
-        # 2. Locate study session
-        session = next(
-            (s for s in learning_plan.sessions if s.id == study_session_id),
-            None
+        # 1. Load session and canonical question concurrently — the two
+        #    fetches are independent, so latency is max(t1, t2), not t1+t2.
+        session_future = _fetch_executor.submit(
+            self.learning_plan_repository.get_session,
+            learning_plan_id,
+            study_session_id,
+        )
+        question_future = _fetch_executor.submit(
+            self.question_repository.get_by_id, question_id
         )
+        session = session_future.result()
+        question = question_future.result()
+
         if not session:
+            # Miss path only: figure out which part was missing
+            if not self.learning_plan_repository.get_by_id(learning_plan_id):
+                raise LearningPlanNotFoundException(learning_plan_id=learning_plan_id)
             raise StudySessionNotFoundException(study_session_id=study_session_id)
 
         # 3. Locate session question
@@ -63,8 +77,7 @@ class AssessQuestionOutcomeUseCase:
         if not attempt:
             raise NoUnassessedAnswerAttemptException(question_id=question_id)
 
-        # 5. Load canonical question
-        question = self.question_repository.get_by_id(question_id)
+        # 5. Validate canonical question (fetched concurrently in step 1)
         if not question:
             raise QuestionNotFoundException(question_id=question_id)
 
@@ -74,10 +87,18 @@ class AssessQuestionOutcomeUseCase:
             user_answer=attempt.user_answer,
         )
 
-        # 7. Attach assessment to attempt
-        session_question.attach_assessment(attempt, assessment)
+        # 7. Attach assessment to attempt (via the session so its
+        #    completed_count stays in sync)
+        session.attach_assessment(question_id, attempt, assessment)
 
-        # 8. Persist aggregate
-        self.learning_plan_repository.save(learning_plan)
+        # 8. Persist only the mutated session question in one flush
+        uow = UnitOfWork(
+            learning_plan_repository=self.learning_plan_repository,
+            question_repository=self.question_repository,
+        )
+        uow.register_session_question(
+            learning_plan_id, study_session_id, session_question
+        )
+        uow.commit()
 
         return assessment
@@ -15,6 +15,8 @@ from application.common.exceptions import (
     KUNotGeneratedException,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CreateLearningPlanFromDocumentUseCase:
@@ -33,7 +35,10 @@ class CreateLearningPlanFromDocumentUseCase:
     learning_plan_repository: LearningPlanRepository
 
     def execute(self, documents: List[Document]) -> LearningPlan:
-        logging.info("[CreateLearningPlanFromDocumentUseCase] Creating learning plan from documents.")
+        logger.info("[CreateLearningPlanFromDocumentUseCase] Creating learning plan from documents.")
+        # Single clock read for every timestamp created in this execution
+        now = datetime.now(UTC)
+
         # 1. Generate knowledge units from the document
         knowledge_units = self.ku_generator.generate_knowledge_units(documents)
 
@@ -48,10 +53,10 @@ class CreateLearningPlanFromDocumentUseCase:
 
         # 3. Create the LearningPlan aggregate
         learning_plan = LearningPlan(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             knowledge_units=knowledge_units,
             sessions=[],
-            created_at=datetime.now(UTC),
+            created_at=now,
         )
 
         # 4. Persist the LearningPlan (aggregate root)
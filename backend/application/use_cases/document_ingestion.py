@@ -5,6 +5,8 @@ from domain.entities.document import Document, DocumentID
 from domain.ports.document_parser import DocumentParser
 from domain.ports.document_repository import DocumentRepository
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class IngestDocumentUseCase:
@@ -40,7 +42,7 @@ class IngestDocumentUseCase:
         ValueError
             If the file format is not supported or parsing fails.
         """
-        logging.info("[IngestDocumentUseCase] Starting document ingestion.")
+        logger.info("[IngestDocumentUseCase] Starting document ingestion.")
 
         # Parse raw bytes into Document entity
         document = self.document_parser.parse(file_bytes, filename)
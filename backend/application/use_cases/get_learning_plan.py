@@ -7,6 +7,8 @@ from application.common.exceptions import (
     LearningPlanNotFoundException,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GetLearningPlanUseCase:
@@ -17,7 +19,7 @@ class GetLearningPlanUseCase:
     learning_plan_repository: LearningPlanRepository
 
     def execute(self, learning_plan_id: str) -> LearningPlan:
-        logging.info("[GetLearningPlanUseCase] Retrieving learning plan.")
+        logger.debug("[GetLearningPlanUseCase] Retrieving learning plan.")
 
         plan = self.learning_plan_repository.get_by_id(learning_plan_id)
         if not plan:
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 import logging
 
-from application.dto.study_session_view import StudySessionView
+from application.dto.study_session_view import (
+    StudySessionView,
+    StudySessionProgressView,
+)
 from application.services.study_session_view import StudySessionViewService
 from domain.ports.learning_plan_repository import LearningPlanRepository
 from application.common.exceptions import (
@@ -9,9 +12,21 @@ from application.common.exceptions import (
     StudySessionNotFoundException,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GetStudySessionViewUseCase:
+    """
+    Read-side use case: resolves one session and shapes it for the client.
+
+    Acts as the query path of the app: the repository serves the target
+    session without hydrating sibling sessions, and the view service
+    batch-fetches only the question rows the view needs. A datastore-backed
+    deployment can push this further by implementing get_session as a
+    single denormalized projection query.
+    """
+
     learning_plan_repo: LearningPlanRepository
     view_service: StudySessionViewService
 
@@ -20,14 +35,27 @@ class GetStudySessionViewUseCase:
         learning_plan_id: str,
         study_session_id: str,
     ) -> StudySessionView:
-        logging.info("[GetStudySessionViewUseCase] Retrieving study session view.")
-        plan = self.learning_plan_repo.get_by_id(learning_plan_id)
-        if not plan:
-            raise LearningPlanNotFoundException(learning_plan_id=learning_plan_id)
+        logger.debug("[GetStudySessionViewUseCase] Retrieving study session view.")
+        session = self._get_session(learning_plan_id, study_session_id)
+        return self.view_service.build_view(session)
 
-        sessions = [s for s in plan.sessions if s.id == study_session_id]
-        if len(sessions) == 0:
-            raise StudySessionNotFoundException(study_session_id=study_session_id)
-        session = sessions[0]
+    def execute_progress(
+        self,
+        learning_plan_id: str,
+        study_session_id: str,
+    ) -> StudySessionProgressView:
+        """Cheaper variant for polling: progress only, no question payloads."""
+        session = self._get_session(learning_plan_id, study_session_id)
+        return self.view_service.build_progress_view(session)
 
-        return self.view_service.build_view(session)
\ No newline at end of file
+    def _get_session(self, learning_plan_id: str, study_session_id: str):
+        # Targeted fetch: only the session, not the whole aggregate
+        session = self.learning_plan_repo.get_session(
+            learning_plan_id, study_session_id
+        )
+        if not session:
+            # Miss path only: figure out which part was missing
+            if not self.learning_plan_repo.get_by_id(learning_plan_id):
+                raise LearningPlanNotFoundException(learning_plan_id=learning_plan_id)
+            raise StudySessionNotFoundException(study_session_id=study_session_id)
+        return session
\ No newline at end of file
@@ -1,19 +1,72 @@
 from dataclasses import dataclass
 import logging
-from typing import List
+from typing import List, Optional
 
 from domain.ports.learning_plan_repository import LearningPlanRepository
-from domain.entities.learning import LearningPlan
+from application.dto.learning_plan_summary import (
+    LearningPlanSummary,
+    StudySessionSummary,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class ListLearningPlansUseCase:
     """
-    Lists all active (non-completed) learning plans.
+    Lists active (non-completed) learning plans as card-sized summaries.
+
+    Returns projections rather than full aggregates: list views only need
+    counts, mastery and session progress, so shipping whole plans (every
+    session, attempt and question) to the API layer is wasted work. The
+    page window is pushed down to the repository.
     """
 
     learning_plan_repository: LearningPlanRepository
 
-    def execute(self) -> List[LearningPlan]:
-        logging.info("[ListLearningPlansUseCase] Listing active learning plans.")
-        return self.learning_plan_repository.list_active()
+    def execute(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[LearningPlanSummary]:
+        # No default page size: callers that do not paginate get every
+        # active plan, as the endpoint always did. Callers that want a
+        # window pass limit/offset and the repository slices lazily.
+        logger.debug("[ListLearningPlansUseCase] Listing active learning plans.")
+        plans = self.learning_plan_repository.list_active(
+            limit=limit, offset=offset
+        )
+
+        summaries: List[LearningPlanSummary] = []
+        for plan in plans:
+            knowledge_units = plan.knowledge_units
+            if knowledge_units:
+                average_mastery = sum(
+                    ku.mastery_level for ku in knowledge_units
+                ) / len(knowledge_units)
+            else:
+                average_mastery = 0.0
+
+            incomplete_sessions = [
+                StudySessionSummary(
+                    session_id=session.id,
+                    questions_answered=session.completed_count,
+                    total_questions=len(session.questions),
+                    max_questions=session.max_questions,
+                    started_at=session.started_at,
+                )
+                for session in plan.sessions
+                if not session.is_completed()
+            ]
+
+            summaries.append(
+                LearningPlanSummary(
+                    learning_plan_id=str(plan.id),
+                    knowledge_unit_count=len(knowledge_units),
+                    average_mastery=average_mastery,
+                    created_at=plan.created_at,
+                    completed_at=plan.completed_at,
+                    session_count=len(plan.sessions),
+                    incomplete_sessions=incomplete_sessions,
+                )
+            )
+
+        return summaries
@@ -1,6 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, UTC
-import itertools
 import logging
 import uuid
 
@@ -16,6 +16,15 @@ from application.common.exceptions import (
 )
 
 
+# Shared pool so the per-KU LLM generation calls run concurrently; total
+# latency becomes roughly the slowest single call instead of the sum.
+_generation_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="question-gen"
+)
+
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class StartStudySessionUseCase:
     """
@@ -23,8 +32,8 @@ class StartStudySessionUseCase:
 
     Hackathon version:
     - Focus policy selects candidate KnowledgeUnits
-    - Questions are generated until max_questions is reached
-    - KnowledgeUnits are reused (round-robin)
+    - max_questions is split across the selected KnowledgeUnits and each
+      KU's share is generated with one batch call
     """
 
     learning_plan_repository: LearningPlanRepository
@@ -36,7 +45,10 @@ class StartStudySessionUseCase:
     max_knowledge_units: int = 3
 
     def execute(self, learning_plan_id: str) -> StudySession:
-        logging.info("[StartStudySessionUseCase] Starting new study session.")
+        logger.info("[StartStudySessionUseCase] Starting new study session.")
+        # Single clock read for every timestamp created in this execution
+        now = datetime.now(tz=UTC)
+
         # 1. Load learning plan
         learning_plan: LearningPlan | None = (
             self.learning_plan_repository.get_by_id(learning_plan_id)
@@ -56,41 +68,49 @@ class StartStudySessionUseCase:
             )
 
         # 3. Generate questions using batch generation to avoid repetition
-        questions: list[Question] = []
-
-        # Calculate how many questions per KU
-        questions_per_ku = self.max_questions // len(knowledge_units)
-        remaining_questions = self.max_questions % len(knowledge_units)
-
-        # Generate batch of questions for each KU
-        for i, ku in enumerate(knowledge_units):
-            # Distribute remaining questions to first KUs
-            count = questions_per_ku + (1 if i < remaining_questions else 0)
-            if count > 0:
-                batch = self.question_generator.generate_questions_batch(ku, count)
-                for question in batch:
-                    self.question_repository.save(question)
-                    questions.append(question)
-
-        # 4. Create study session
+        # Calculate how many questions per KU (one divmod, length hoisted)
+        n_kus = len(knowledge_units)
+        questions_per_ku, remaining_questions = divmod(self.max_questions, n_kus)
+
+        # Distribute remaining questions to first KUs
+        plan_per_ku = [
+            (ku, questions_per_ku + (1 if i < remaining_questions else 0))
+            for i, ku in enumerate(knowledge_units)
+        ]
+        plan_per_ku = [(ku, count) for ku, count in plan_per_ku if count > 0]
+
+        # Generate each KU's batch concurrently (results keep KU order) and
+        # flatten in one pass instead of growing a list batch by batch
+        batches = _generation_executor.map(
+            lambda pair: self.question_generator.generate_questions_batch(*pair),
+            plan_per_ku,
+        )
+        questions: list[Question] = [q for batch in batches for q in batch]
+
+        # Persist all generated questions in a single round-trip
+        self.question_repository.save_many(questions)
+
+        # 4. Create study session (hoisted locals keep the per-question
+        #    construction to one attribute lookup per field)
+        _SQ = SessionQuestion
+        session_questions: dict = {}
+        for q in questions:
+            q_id = q.id
+            session_questions[q_id] = _SQ(
+                question_id=q_id,
+                knowledge_unit_id=q.knowledge_unit_id,
+            )
+
         session = StudySession(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             knowledge_units=[ku.id for ku in knowledge_units],
-            questions={
-                q.id: SessionQuestion(
-                    question_id=q.id,
-                    knowledge_unit_id=q.knowledge_unit_id,
-                )
-                for q in questions
-            },
+            questions=session_questions,
             max_questions=self.max_questions,
-            started_at=datetime.now(tz=UTC),
+            started_at=now,
         )
 
-        # 5. Attach session to learning plan
-        learning_plan.sessions.append(session)
-
-        # 6. Persist aggregate root
-        self.learning_plan_repository.save(learning_plan)
+        # 5. Attach and persist the new session with one targeted insert
+        #    instead of rewriting the whole aggregate
+        self.learning_plan_repository.add_session(learning_plan_id, session)
 
         return session
@@ -10,6 +10,8 @@ from application.common.exceptions import (
     QuestionNotInStudySessionException,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SubmitAnswerUseCase:
@@ -27,30 +29,24 @@ class SubmitAnswerUseCase:
         question_id: QuestionID,
         user_answer: Answer,
     ) -> None:
-        logging.info("[SubmitAnswerUseCase] Submitting answer to question.")
-        # 1. Load aggregate root
-        learning_plan = self.learning_plan_repository.get_by_id(learning_plan_id)
-        if not learning_plan:
-            raise LearningPlanNotFoundException(learning_plan_id=learning_plan_id)
+        logger.debug("[SubmitAnswerUseCase] Submitting answer to question.")
+        # Happy path: one specialized repository call records the attempt
+        # without hydrating the session in the use case.
+        matched = self.learning_plan_repository.submit_answer(
+            learning_plan_id, study_session_id, question_id, user_answer
+        )
+        if matched:
+            return
 
-        # 2. Locate study session
-        session = next(
-            (s for s in learning_plan.sessions if s.id == study_session_id),
-            None
+        # Miss path only: figure out which part was missing
+        session = self.learning_plan_repository.get_session(
+            learning_plan_id, study_session_id
         )
         if not session:
+            if not self.learning_plan_repository.get_by_id(learning_plan_id):
+                raise LearningPlanNotFoundException(learning_plan_id=learning_plan_id)
             raise StudySessionNotFoundException(study_session_id=study_session_id)
-
-        # 3. Validate question belongs to session
-        session_question = session.questions.get(question_id)
-        if not session_question:
-            raise QuestionNotInStudySessionException(
-                question_id=question_id,
-                study_session_id=study_session_id
-            )
-
-        # 4. Submit answer (creates AnswerAttempt)
-        session_question.submit_answer(user_answer)
-
-        # 5. Persist aggregate
-        self.learning_plan_repository.save(learning_plan)
\ No newline at end of file
+        raise QuestionNotInStudySessionException(
+            question_id=question_id,
+            study_session_id=study_session_id
+        )
\ No newline at end of file
@@ -7,6 +7,8 @@ from domain.ports.feedback_service import AssessmentFeedbackService
 from domain.entities.question import AssessmentFeedback, QuestionID, FeedbackID
 from domain.entities.learning import LearningPlanID, StudySessionID
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SubmitAssessmentFeedbackUseCase:
@@ -43,14 +45,17 @@ class SubmitAssessmentFeedbackUseCase:
         score: int = 5 if assessment_feedback_dto.agrees else 1
         comment: str | None = assessment_feedback_dto.comment
 
-        logging.info(
-            f"[SubmitAssessmentFeedbackUseCase] Submitting feedback for question {question_id} "
-            f"in session {session_id}, learning plan {learning_plan_id}"
+        logger.info(
+            "[SubmitAssessmentFeedbackUseCase] Submitting feedback for question %s "
+            "in session %s, learning plan %s",
+            question_id,
+            session_id,
+            learning_plan_id,
         )
 
         # Create feedback entity
         feedback = AssessmentFeedback(
-            id=FeedbackID(str(uuid4())),
+            id=FeedbackID(uuid4().hex),
             question_id=question_id,
             learning_plan_id=learning_plan_id,
             session_id=session_id,
@@ -61,8 +66,9 @@ class SubmitAssessmentFeedbackUseCase:
         # Submit through feedback service
         self.feedback_service.submit_feedback(feedback)
 
-        logging.info(
-            f"[SubmitAssessmentFeedbackUseCase] Feedback submitted successfully: {feedback.id}"
+        logger.info(
+            "[SubmitAssessmentFeedbackUseCase] Feedback submitted successfully: %s",
+            feedback.id,
         )
 
         return feedback
@@ -7,6 +7,8 @@ from domain.ports.feedback_service import QuestionFeedbackService
 from domain.entities.question import QuestionFeedback, QuestionID, FeedbackID
 from domain.entities.learning import LearningPlanID, StudySessionID
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SubmitQuestionFeedbackUseCase:
@@ -42,14 +44,17 @@ class SubmitQuestionFeedbackUseCase:
         session_id: StudySessionID = question_feedback_dto.session_id
         is_helpful: bool = question_feedback_dto.is_helpful
 
-        logging.info(
-            f"[SubmitQuestionFeedbackUseCase] Submitting feedback for question {question_id} "
-            f"in session {session_id}, learning plan {learning_plan_id}"
+        logger.info(
+            "[SubmitQuestionFeedbackUseCase] Submitting feedback for question %s "
+            "in session %s, learning plan %s",
+            question_id,
+            session_id,
+            learning_plan_id,
         )
 
         # Create feedback entity
         feedback = QuestionFeedback(
-            id=FeedbackID(str(uuid4())),
+            id=FeedbackID(uuid4().hex),
             question_id=question_id,
             learning_plan_id=learning_plan_id,
             session_id=session_id,
@@ -59,8 +64,9 @@ class SubmitQuestionFeedbackUseCase:
         # Submit through feedback service
         self.feedback_service.submit_feedback(feedback)
 
-        logging.info(
-            f"[SubmitQuestionFeedbackUseCase] Feedback submitted successfully: {feedback.id}"
+        logger.info(
+            "[SubmitQuestionFeedbackUseCase] Feedback submitted successfully: %s",
+            feedback.id,
         )
 
         return feedback
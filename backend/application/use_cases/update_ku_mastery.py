@@ -6,12 +6,13 @@ from domain.ports.question_repository import QuestionRepository
 from domain.services.mastery import MasteryService
 from domain.entities.learning import SessionQuestion
 from domain.entities.knowledge_unit import KnowledgeUnit
-from domain.entities.question import QuestionStatus
 from application.common.exceptions import (
     LearningPlanNotFoundException,
     KUNotInLearningPlanException,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class UpdateKnowledgeUnitMasteryUseCase:
@@ -28,30 +29,26 @@ class UpdateKnowledgeUnitMasteryUseCase:
         learning_plan_id: str,
         knowledge_unit_id: str,
     ) -> KnowledgeUnit:
-        logging.info("[UpdateKnowledgeUnitMasteryUseCase] Updating knowledge unit mastery.")
+        logger.info("[UpdateKnowledgeUnitMasteryUseCase] Updating knowledge unit mastery.")
         # 1. Load aggregate root
         plan = self.learning_plan_repository.get_by_id(learning_plan_id)
         if not plan:
             raise LearningPlanNotFoundException(learning_plan_id=learning_plan_id)
 
         # 2. Find KnowledgeUnit
-        ku = next(
-            (ku for ku in plan.knowledge_units if ku.id == knowledge_unit_id),
-            None
-        )
+        ku = plan.get_knowledge_unit(knowledge_unit_id)
         if not ku:
             raise KUNotInLearningPlanException(
                 knowledge_unit_id=knowledge_unit_id,
                 learning_plan_id=learning_plan_id
             )
 
-        # 3. Collect session questions for this KU
-        session_questions: list[SessionQuestion] = []
-
-        for session in plan.sessions:
-            for sq in session.questions.values():
-                if sq.knowledge_unit_id == ku.id and sq.status != QuestionStatus.PENDING:
-                    session_questions.append(sq)
+        # 3. Fetch assessed session questions for this KU in one call
+        session_questions: list[SessionQuestion] = (
+            self.learning_plan_repository.list_session_questions_for_ku(
+                learning_plan_id, ku.id
+            )
+        )
 
         # 4. Update mastery
         self.mastery_service.update_mastery(
@@ -1,13 +1,19 @@
 """Dependency injection container for Socrates application."""
 import logging
-from functools import partial
+from functools import cache, partial
 
+import httpx
 from openai import OpenAI
 from opik import track
 from opik.integrations.openai import track_openai
 from vyper import v
 
-# Domain services
+# Domain services and ports
+from domain.entities.question import AssessmentFeedback, QuestionFeedback
+from domain.ports.feedback_service import (
+    AssessmentFeedbackService,
+    QuestionFeedbackService,
+)
 from domain.services.mastery import QuestionBasedMasteryService
 
 # Application services and use cases
@@ -29,9 +35,13 @@ from application.use_cases.submit_question_feedback import SubmitQuestionFeedbac
 # Infrastructure adapters - Repositories
 from infrastructure.adapters.document_repository import InMemoryDocumentRepository
 from infrastructure.adapters.learning_plan_repository import (
+    IdentityMapLearningPlanRepository,
     InMemoryLearningPlanRepository,
 )
-from infrastructure.adapters.question_repository import InMemoryQuestionRepository
+from infrastructure.adapters.question_repository import (
+    CachingQuestionRepository,
+    InMemoryQuestionRepository,
+)
 
 # Infrastructure adapters - Policies
 from infrastructure.adapters.learning_scope_policy import NaiveLearningScopePolicy
@@ -67,59 +77,99 @@ from infrastructure.api.fastapi.submit_assessment_feedback_api import SubmitAsse
 from infrastructure.api.fastapi.submit_question_feedback_api import SubmitQuestionFeedbackAPIImpl
 
 
-# Singleton instances
-_openai_client = None  # TODO: Maybe for the client we do not need singleton?
-_document_repository = None
-_learning_plan_repository = None
-_question_repository = None
+# Shared opik span metadata, built once instead of rebuilding the dict
+# literal per factory invocation. Plain dicts on purpose: opik validates
+# opik_args with isinstance(..., dict), so a mappingproxy would be
+# rejected and the span tags silently dropped. Opik never mutates them.
+_KU_GENERATION_ARGS = {"span": {"tags": ["knowledge_unit_generation"]}}
+_QUESTION_BATCH_ARGS = {"span": {"tags": ["question_generation_batch"]}}
+_QUESTION_NEXT_ARGS = {"span": {"tags": ["question_generation_next"]}}
+_ANSWER_EVALUATION_ARGS = {"span": {"tags": ["answer_evaluation"]}}
+
+
+# Config values read by multiple factories, resolved once.
+@cache
+def _opik_enabled() -> bool:
+    return v.get_bool("opik.enable_tracking")
+
+
+@cache
+def _completion_model() -> str:
+    return v.get_string("openai.completion_model")
+
+
+@cache
+def _vision_model() -> str:
+    return v.get_string("openai.vision_model")
+
+
+@cache
+def _max_questions() -> int:
+    return v.get_int("study_session.max_questions")
+
 
+# Singletons are memoized with functools.cache: the C-level wrapper makes
+# repeat calls a dict lookup. Note the factory itself is not locked —
+# two threads racing an uncached call can both run it and briefly hold
+# different instances. FastAPI wires these at startup on one thread, so
+# that race does not occur in practice; if these ever get resolved from
+# concurrent request handlers, add a lock around first construction.
 
+
+@cache
 def get_openai_client() -> OpenAI:
     """Get or create OpenAI client instance."""
-    global _openai_client
-    if _openai_client is None:
-        api_key = v.get_string("openai.api_key")
-        if v.get_bool("opik.enable_tracking"):
-            _openai_client = track_openai(OpenAI(api_key=api_key))
-        else:
-            _openai_client = OpenAI(api_key=api_key)
-        logging.info("[Injector] OpenAI client initialized")
-    return _openai_client
+    api_key = v.get_string("openai.api_key")
+    # Explicit pooling/keep-alive: every LLM-backed service shares this
+    # client, so reusing warm connections avoids a TLS handshake per call.
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_keepalive_connections=64,
+            max_connections=128,
+            keepalive_expiry=60.0,
+        ),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+    # The SDK retries 429/5xx and connection errors with exponential
+    # backoff; 5 attempts rides out rate-limit bursts now that question
+    # generation and OCR batches run concurrently.
+    if _opik_enabled():
+        client = track_openai(
+            OpenAI(api_key=api_key, http_client=http_client, max_retries=5)
+        )
+    else:
+        client = OpenAI(api_key=api_key, http_client=http_client, max_retries=5)
+    logging.info("[Injector] OpenAI client initialized")
+    return client
 
 
+@cache
 def get_document_repository() -> InMemoryDocumentRepository:
     """Get or create document repository instance."""
-    global _document_repository
-    if _document_repository is None:
-        _document_repository = InMemoryDocumentRepository()
-        logging.info("[Injector] Document repository initialized")
-    return _document_repository
+    logging.info("[Injector] Document repository initialized")
+    return InMemoryDocumentRepository()
 
 
+@cache
 def get_learning_plan_repository() -> InMemoryLearningPlanRepository:
     """Get or create learning plan repository instance."""
-    global _learning_plan_repository
-    if _learning_plan_repository is None:
-        _learning_plan_repository = InMemoryLearningPlanRepository(_plans={})
-        logging.info("[Injector] Learning plan repository initialized")
-    return _learning_plan_repository
+    logging.info("[Injector] Learning plan repository initialized")
+    return InMemoryLearningPlanRepository(_plans={})
 
 
+@cache
 def get_question_repository() -> InMemoryQuestionRepository:
     """Get or create question repository instance."""
-    global _question_repository
-    if _question_repository is None:
-        _question_repository = InMemoryQuestionRepository(_questions={})
-        logging.info("[Injector] Question repository initialized")
-    return _question_repository
+    logging.info("[Injector] Question repository initialized")
+    return InMemoryQuestionRepository(_questions={})
 
 
 def get_document_parser() -> LLMOCRDocumentParser:
     """Create document parser instance."""
     client = get_openai_client()
-    model = v.get_string("openai.vision_model")
+    model = _vision_model()
     doc_parser = LLMOCRDocumentParser(client=client, model=model)
-    if v.get_bool("opik.enable_tracking"):
+    if _opik_enabled():
         doc_parser.parse = track(doc_parser.parse)
     return doc_parser
 
@@ -127,16 +177,12 @@ def get_document_parser() -> LLMOCRDocumentParser:
 def get_knowledge_unit_generator() -> LLMKnowledgeUnitGenerationService:
     """Create knowledge unit generation service instance."""
     client = get_openai_client()
-    model = v.get_string("openai.completion_model")
+    model = _completion_model()
     service = LLMKnowledgeUnitGenerationService(client=client, model=model)
-    if v.get_bool("opik.enable_tracking"):
+    if _opik_enabled():
         service.generate_knowledge_units = partial(
             track(service.generate_knowledge_units),
-            opik_args={
-                "span": {
-                    "tags": ["knowledge_unit_generation"],
-                }
-            }
+            opik_args=_KU_GENERATION_ARGS,
         )
     return service
 
@@ -144,26 +190,18 @@ def get_knowledge_unit_generator() -> LLMKnowledgeUnitGenerationService:
 def get_question_generator() -> LLMQuestionGenerationService:
     """Create question generation service instance."""
     client = get_openai_client()
-    model = v.get_string("openai.completion_model")
+    model = _completion_model()
     service = LLMQuestionGenerationService(client=client, model=model)
-    if v.get_bool("opik.enable_tracking"):
+    if _opik_enabled():
         # service.generate_questions_batch = track(service.generate_questions_batch)
         # service.generate_next_question = track(service.generate_next_question)
         service.generate_questions_batch = partial(
             track(service.generate_questions_batch),
-            opik_args={
-                "span": {
-                    "tags": ["question_generation_batch"],
-                }
-            }
+            opik_args=_QUESTION_BATCH_ARGS,
         )
         service.generate_next_question = partial(
             track(service.generate_next_question),
-            opik_args={
-                "span": {
-                    "tags": ["question_generation_next"],
-                }
-            }
+            opik_args=_QUESTION_NEXT_ARGS,
         )
     return service
 
@@ -172,17 +210,13 @@ def get_answer_evaluator() -> LLMAnswerEvaluationService:
     """Create answer evaluation service instance."""
     service = LLMAnswerEvaluationService(
         client=get_openai_client(),
-        model=v.get_string("openai.completion_model"),
+        model=_completion_model(),
     )
-    if v.get_bool("opik.enable_tracking"):
+    if _opik_enabled():
         # service.evaluate = track(service.evaluate)
         service.evaluate = partial(
             track(service.evaluate),
-            opik_args={
-                "span": {
-                    "tags": ["answer_evaluation"],
-                }
-            }
+            opik_args=_ANSWER_EVALUATION_ARGS,
         )
     return service
 
@@ -201,41 +235,46 @@ def get_mastery_service() -> QuestionBasedMasteryService:
     return QuestionBasedMasteryService()
 
 
-def get_assessment_feedback_service() -> OpikAssessmentFeedbackService:
-    """Create assessment feedback service instance."""
-    if v.get_bool("opik.enable_tracking"):
-        return OpikAssessmentFeedbackService()
-    else:
-        # Return a no-op version if tracking is disabled
-        from domain.ports.feedback_service import AssessmentFeedbackService
-        from domain.entities.question import AssessmentFeedback
+class _NoOpAssessmentFeedbackService(AssessmentFeedbackService):
+    """Drop-in used when tracking is disabled; logs and discards feedback."""
 
-        class NoOpAssessmentFeedbackService(AssessmentFeedbackService):
-            def submit_feedback(self, feedback: AssessmentFeedback) -> None:
-                logging.info(f"[NoOpAssessmentFeedbackService] Feedback submission disabled: {feedback.id}")
+    def submit_feedback(self, feedback: AssessmentFeedback) -> None:
+        logging.info(
+            "[NoOpAssessmentFeedbackService] Feedback submission disabled: %s",
+            feedback.id,
+        )
 
-        return NoOpAssessmentFeedbackService()
 
+class _NoOpQuestionFeedbackService(QuestionFeedbackService):
+    """Drop-in used when tracking is disabled; logs and discards feedback."""
+
+    def submit_feedback(self, feedback: QuestionFeedback) -> None:
+        logging.info(
+            "[NoOpQuestionFeedbackService] Feedback submission disabled: %s",
+            feedback.id,
+        )
 
-def get_question_feedback_service() -> OpikQuestionFeedbackService:
-    """Create question feedback service instance."""
-    if v.get_bool("opik.enable_tracking"):
-        return OpikQuestionFeedbackService()
-    else:
-        # Return a no-op version if tracking is disabled
-        from domain.ports.feedback_service import QuestionFeedbackService
-        from domain.entities.question import QuestionFeedback
 
-        class NoOpQuestionFeedbackService(QuestionFeedbackService):
-            def submit_feedback(self, feedback: QuestionFeedback) -> None:
-                logging.info(f"[NoOpQuestionFeedbackService] Feedback submission disabled: {feedback.id}")
+@cache
+def get_assessment_feedback_service() -> AssessmentFeedbackService:
+    """Create assessment feedback service instance."""
+    if _opik_enabled():
+        return OpikAssessmentFeedbackService()
+    return _NoOpAssessmentFeedbackService()
 
-        return NoOpQuestionFeedbackService()
+
+@cache
+def get_question_feedback_service() -> QuestionFeedbackService:
+    """Create question feedback service instance."""
+    if _opik_enabled():
+        return OpikQuestionFeedbackService()
+    return _NoOpQuestionFeedbackService()
 
 
 def get_study_session_view_service() -> StudySessionViewService:
     """Create study session view service instance."""
-    question_repo = get_question_repository()
+    # Identity-map wrapper: repeated view builds reuse already-fetched questions
+    question_repo = CachingQuestionRepository(_inner=get_question_repository())
     return StudySessionViewService(question_repository=question_repo)
 
 
@@ -273,7 +312,7 @@ def get_list_learning_plans_use_case() -> ListLearningPlansUseCase:
 
 def get_start_study_session_use_case() -> StartStudySessionUseCase:
     """Create start study session use case instance."""
-    max_questions = v.get_int("study_session.max_questions")
+    max_questions = _max_questions()
     return StartStudySessionUseCase(
         learning_plan_repository=get_learning_plan_repository(),
         study_focus_policy=get_study_focus_policy(),
@@ -286,7 +325,9 @@ def get_start_study_session_use_case() -> StartStudySessionUseCase:
 def get_get_study_session_use_case() -> GetStudySessionViewUseCase:
     """Create get study session use case instance."""
     return GetStudySessionViewUseCase(
-        learning_plan_repo=get_learning_plan_repository(),
+        learning_plan_repo=IdentityMapLearningPlanRepository(
+            _inner=get_learning_plan_repository()
+        ),
         view_service=get_study_session_view_service(),
     )
 
@@ -302,7 +343,9 @@ def get_assess_question_use_case() -> AssessQuestionOutcomeUseCase:
     """Create assess question use case instance."""
     return AssessQuestionOutcomeUseCase(
         learning_plan_repository=get_learning_plan_repository(),
-        question_repository=get_question_repository(),
+        question_repository=CachingQuestionRepository(
+            _inner=get_question_repository()
+        ),
         answer_evaluation_service=get_answer_evaluator(),
     )
 
@@ -330,14 +373,17 @@ def get_submit_question_feedback_use_case() -> SubmitQuestionFeedbackUseCase:
 
 
 # API implementations
+def _maybe_track(api, method_name: str):
+    """Single place where the tracking policy is applied to API methods."""
+    if _opik_enabled():
+        setattr(api, method_name, track(getattr(api, method_name)))
+    return api
+
+
 def get_ingest_document_api() -> IngestDocumentAPIBase:
     """Create ingest document API instance."""
     api = IngestDocumentAPIBase(ingest_document_use_case=get_ingest_document_use_case())
-
-    if v.get_bool("opik.enable_tracking"):
-        api.ingest_document = track(api.ingest_document)
-
-    return api
+    return _maybe_track(api, "ingest_document")
 
 
 def get_create_learning_plan_api() -> CreateLearningPlanAPIImpl:
@@ -346,11 +392,7 @@ def get_create_learning_plan_api() -> CreateLearningPlanAPIImpl:
         create_learning_plan_use_case=get_create_learning_plan_use_case(),
         document_repository=get_document_repository(),
     )
-
-    if v.get_bool("opik.enable_tracking"):
-        api.create_learning_plan = track(api.create_learning_plan)
-
-    return api
+    return _maybe_track(api, "create_learning_plan")
 
 
 def get_learning_plan_api() -> GetLearningPlanAPIImpl:
@@ -372,11 +414,7 @@ def get_start_study_session_api() -> StartStudySessionAPIImpl:
     api = StartStudySessionAPIImpl(
         start_study_session_use_case=get_start_study_session_use_case()
     )
-
-    if v.get_bool("opik.enable_tracking"):
-        api.start_study_session = track(api.start_study_session)
-
-    return api
+    return _maybe_track(api, "start_study_session")
 
 
 def get_get_study_session_api() -> GetStudySessionAPIImpl:
@@ -394,9 +432,7 @@ def get_submit_answer_api() -> SubmitAnswerAPIImpl:
 def get_assess_question_api() -> AssessQuestionAPIImpl:
     """Create assess question API instance."""
     api = AssessQuestionAPIImpl(assess_question_use_case=get_assess_question_use_case())
-    if v.get_bool("opik.enable_tracking"):
-        api.assess_question = track(api.assess_question)
-    return api
+    return _maybe_track(api, "assess_question")
 
 
 def get_update_mastery_api() -> UpdateMasteryAPIImpl:
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from domain.entities.document import DocumentID, DocLocation
 
 
-@dataclass
+@dataclass(slots=True)
 class Claim:
     """A discrete piece of knowledge extracted from a text that can be directly
     or indirectly verified using the text itself."""
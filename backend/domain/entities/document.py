@@ -8,7 +8,7 @@ DocumentID = NewType("DocumentID", str)
 DocLocation = NewType("DocLocation", str)
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     id: DocumentID
     text: str
@@ -7,7 +7,7 @@ from domain.entities.claim import Claim
 KnowledgeUnitID = NewType("KnowledgeUnitID", str)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class KnowledgeUnit:
     """A base class for knowledge units (claims or skills)."""
     id: KnowledgeUnitID
@@ -17,13 +17,13 @@ class KnowledgeUnit:
     document_references: List[DocumentID] = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SkillKnowledge(KnowledgeUnit):
     """Knowledge about a skill derived from one or more claims."""
     source_claims: List[Claim]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FactKnowledge(KnowledgeUnit):
     """Knowledge about a document claim."""
     # source_claims: List[Claim]  #  NOTE: We may have to update this if we want to infer complex claims from simpler ones
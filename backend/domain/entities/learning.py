@@ -1,10 +1,17 @@
 from dataclasses import dataclass, field
+from functools import partial
 from typing import List, Optional, NewType
 import uuid
 from datetime import datetime, UTC
 
 from domain.entities.knowledge_unit import KnowledgeUnit, KnowledgeUnitID
-from domain.entities.question import QuestionID, SessionQuestion, QuestionStatus
+from domain.entities.question import (
+    AnswerAssessment,
+    AnswerAttempt,
+    QuestionID,
+    SessionQuestion,
+    QuestionStatus,
+)
 from domain.common.exceptions import (
     LearningPlanIsAlreadyCompletedException,
     StudySessionFullException,
@@ -15,18 +22,23 @@ StudySessionID = NewType("StudySessionID", str)
 LearningPlanID = NewType("LearningPlanID", str)
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class StudySession:
     """
     A bounded learning interaction consisting of a finite number of questions.
     Owned by a LearningPlan.
+
+    ``questions`` stays a dict keyed by question ID: unlike a plain list it
+    also serves the O(1) keyed lookups on the answer-submission and
+    assessment hot paths, and with slots the per-session overhead is small.
     """
     id: StudySessionID
     knowledge_units: list[KnowledgeUnitID]
     max_questions: int
     questions: dict[QuestionID, SessionQuestion] = field(default_factory=dict)
-    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime = field(default_factory=partial(datetime.now, UTC))
     ended_at: datetime | None = None
+    completed_count: int = 0
 
     def can_ask_more_questions(self) -> bool:
         return len(self.questions) < self.max_questions and self.ended_at is None
@@ -40,6 +52,28 @@ class StudySession:
 
         self.questions[question_id] = SessionQuestion(question_id=question_id)
 
+    def attach_assessment(
+        self,
+        question_id: QuestionID,
+        attempt: AnswerAttempt,
+        assessment: AnswerAssessment,
+    ) -> None:
+        """
+        Attach an assessment to a question's attempt, keeping the
+        session-level ``completed_count`` in sync.
+
+        Status transitions are monotonic (PENDING -> CORRECT/INCORRECT on the
+        first assessment), so the counter is incremented exactly once per
+        question and progress can be read in O(1).
+        """
+        session_question = self.questions[question_id]
+        was_pending = session_question.status == QuestionStatus.PENDING
+        session_question.attach_assessment(attempt, assessment)
+        # Attaching an assessment always moves a pending question to
+        # CORRECT/INCORRECT, so the counter is bumped exactly once.
+        if was_pending:
+            self.completed_count += 1
+
     def is_completed(self) -> bool:
         """
         A session is complete when:
@@ -50,25 +84,22 @@ class StudySession:
         if self.ended_at is not None:
             return True
 
-        # Auto-complete: all questions answered
-        if len(self.questions) > 0:
-            all_answered = all(
-                q.status != QuestionStatus.PENDING
-                for q in self.questions.values()
-            )
-            if all_answered:
-                return True
-
-        return False
+        # Auto-complete: all questions answered. completed_count is kept in
+        # sync by attach_assessment, so this is O(1) instead of a full scan.
+        return len(self.questions) > 0 and self.completed_count == len(self.questions)
 
     def end_early(self) -> None:
         """Explicitly end the session before all questions are answered."""
         if self.ended_at is None:
             self.ended_at = datetime.now(UTC)
+            # No more attempts will be appended; compact each question's
+            # attempt list into a tuple.
+            for session_question in self.questions.values():
+                session_question.freeze()
 
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class LearningPlan:
     """
     Represents a learner's intent to master a set of KnowledgeUnits over time.
@@ -77,21 +108,100 @@ class LearningPlan:
     id: LearningPlanID
     knowledge_units: List[KnowledgeUnit]
     sessions: List[StudySession] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=partial(datetime.now, UTC))
     completed_at: datetime | None = None
+    # Secondary indexes, built in __post_init__ and kept in sync by the
+    # mutators below; declared as fields so they get slots too.
+    _sessions_by_id: dict[StudySessionID, StudySession] = field(
+        init=False, repr=False, compare=False
+    )
+    _kus_by_id: dict[KnowledgeUnitID, KnowledgeUnit] = field(
+        init=False, repr=False, compare=False
+    )
+    _sqs_by_ku: dict[KnowledgeUnitID, list[SessionQuestion]] = field(
+        init=False, repr=False, compare=False
+    )
+    _sqs_indexed_count: int = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Secondary indexes so lookups by ID are a single hash probe instead
+        # of an O(N) scan per request.
+        self._sessions_by_id = {
+            session.id: session for session in self.sessions
+        }
+        self._kus_by_id = {ku.id: ku for ku in self.knowledge_units}
+        self._sqs_by_ku = {}
+        self._sqs_indexed_count = -1  # force a build on first use
+
+    def _refresh_sq_index(self) -> None:
+        # Session questions are append-only, so a changed total count is a
+        # cheap and sufficient staleness signal for the KU index.
+        total = sum(len(session.questions) for session in self.sessions)
+        if total == self._sqs_indexed_count:
+            return
+
+        sqs_by_ku: dict[KnowledgeUnitID, list[SessionQuestion]] = {}
+        for session in self.sessions:
+            for sq in session.questions.values():
+                if sq.knowledge_unit_id is not None:
+                    sqs_by_ku.setdefault(sq.knowledge_unit_id, []).append(sq)
+        self._sqs_by_ku = sqs_by_ku
+        self._sqs_indexed_count = total
 
     def start_session(self, max_questions: int) -> StudySession:
         if self.is_completed():
             raise LearningPlanIsAlreadyCompletedException(self.id)
 
+        # Sessions hold KU IDs, not the plan's KnowledgeUnit objects: this
+        # matches the declared type, avoids aliasing the plan's own list
+        # into every session, and keeps sessions small (one string per KU).
         session = StudySession(
-            id=str(uuid.uuid4()),
-            knowledge_units=self.knowledge_units,
+            id=uuid.uuid4().hex,
+            knowledge_units=[ku.id for ku in self.knowledge_units],
             max_questions=max_questions
         )
-        self.sessions.append(session)
+        self.add_session(session)
         return session
 
+    def add_session(self, session: StudySession) -> None:
+        """Attach a session to the plan, keeping the ID index in sync."""
+        self.sessions.append(session)
+        self._sessions_by_id[session.id] = session
+
+    @property
+    def sessions_by_id(self) -> dict[StudySessionID, StudySession]:
+        """Read-only view of the session index kept in sync by add_session."""
+        return self._sessions_by_id
+
+    def get_session(self, session_id: StudySessionID) -> Optional[StudySession]:
+        """Retrieve a session by ID in O(1), or None if not found."""
+        return self._sessions_by_id.get(session_id)
+
+    @property
+    def knowledge_units_by_id(self) -> dict[KnowledgeUnitID, KnowledgeUnit]:
+        """Read-only view of the knowledge-unit index."""
+        return self._kus_by_id
+
+    def get_knowledge_unit(
+        self, knowledge_unit_id: KnowledgeUnitID
+    ) -> Optional[KnowledgeUnit]:
+        """Retrieve a knowledge unit by ID in O(1), or None if not found."""
+        return self._kus_by_id.get(knowledge_unit_id)
+
+    def session_questions_for_ku(
+        self, knowledge_unit_id: KnowledgeUnitID
+    ) -> List[SessionQuestion]:
+        """
+        All session questions tied to a knowledge unit, across sessions.
+
+        Served from a secondary index so mastery updates scale with the
+        questions of the requested unit rather than the whole plan.
+        """
+        self._refresh_sq_index()
+        return self._sqs_by_ku.get(knowledge_unit_id, [])
+
     def all_questions(self) -> List[SessionQuestion]:
         return [q for session in self.sessions for q in session.questions.values()]
 
@@ -1,5 +1,6 @@
 from datetime import datetime, UTC
 from enum import Enum
+from functools import lru_cache, partial
 from typing import  NewType, Optional, List
 from dataclasses import dataclass, field
 
@@ -18,30 +19,51 @@ class QuestionStatus(str, Enum):
     INCORRECT = "incorrect"
 
 
-@dataclass
+# Bound once at import time: enum member access goes through
+# EnumMeta.__getattr__, which is noticeably slower than a module-level
+# name on the status hot path.
+_PENDING = QuestionStatus.PENDING
+_CORRECT = QuestionStatus.CORRECT
+_INCORRECT = QuestionStatus.INCORRECT
+
+
+@dataclass(frozen=True, slots=True)
 class Difficulty:
     """Represents the difficulty level of a question."""
     level: int  # e.g., 1 to 5
     description: Optional[str] = ""
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=64)
+def make_difficulty(level: int, description: str = "") -> Difficulty:
+    """Interning factory for :class:`Difficulty`.
+
+    Difficulty is a tiny value object with a handful of distinct values
+    (levels 1-5), so questions share one frozen instance per value instead
+    of allocating a copy each.
+    """
+    return Difficulty(level=level, description=description)
+
+
+@dataclass(slots=True)
 class AnswerAttempt:
+    # Not frozen: attach_assessment fills in ``assessment`` in place once
+    # the evaluation arrives, instead of rebuilding the whole attempt.
     user_answer: Answer
-    answered_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    answered_at: datetime = field(default_factory=partial(datetime.now, UTC))
     assessment: "AnswerAssessment | None" = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnswerAssessment:
     is_correct: bool
     correct_answer: Answer | None = None
     explanation: str | None = None
     confidence: float | None = None
-    assessed_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    assessed_at: datetime = field(default_factory=partial(datetime.now, UTC))
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Question:
     """
     A question designed to test fact comprehension or skill application.
@@ -66,28 +88,60 @@ class Question:
     knowledge_unit_id: KnowledgeUnitID
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class SessionQuestion:
     """
     A Question as it appears within a specific StudySession.
     Holds session-specific state.
     """
     question_id: QuestionID
-    attempts: list[AnswerAttempt] = field(default_factory=list)
+    # A list while the session is live; freeze() swaps in a tuple once the
+    # session closes (tuples carry no over-allocated capacity).
+    attempts: "list[AnswerAttempt] | tuple[AnswerAttempt, ...]" = field(
+        default_factory=list
+    )
     last_answered_at: datetime | None = None
     knowledge_unit_id: KnowledgeUnitID | None = None
+    # Head pointer to the pending attempt, maintained by submit_answer /
+    # attach_assessment so lookups skip the linear scan over attempts.
+    _unassessed_head: AnswerAttempt | None = field(
+        default=None, repr=False, compare=False
+    )
+    # Memoized result of the status scan; invalidated by attach_assessment.
+    _status: "QuestionStatus | None" = field(
+        default=None, repr=False, compare=False
+    )
 
     def submit_answer(self, user_answer: Answer) -> None:
-        self.attempts.append(
-            AnswerAttempt(
-                user_answer=user_answer,
-                answered_at=datetime.now(UTC),
-            )
+        # One clock read covers both timestamps
+        now = datetime.now(UTC)
+        attempt = AnswerAttempt(
+            user_answer=user_answer,
+            answered_at=now,
         )
-        self.last_answered_at = datetime.now(UTC)
-
+        if type(self.attempts) is tuple:
+            # Frozen session question receiving a late write: re-listify so
+            # the append below works as usual.
+            self.attempts = list(self.attempts)
+        self.attempts.append(attempt)
+        self._unassessed_head = attempt
+        self.last_answered_at = now
+
+    def freeze(self) -> None:
+        """
+        Convert ``attempts`` to a tuple once no more writes are expected.
+
+        Lists over-allocate capacity for future appends; a closed session's
+        questions never grow again, so a tuple stores the same attempts in
+        less memory. submit_answer re-listifies if a late write does arrive.
+        """
+        self.attempts = tuple(self.attempts)
 
     def latest_unassessed_attempt(self) -> AnswerAttempt | None:
+        if self._unassessed_head is not None:
+            return self._unassessed_head
+        # Fallback scan covers instances whose attempts list was populated
+        # directly rather than through submit_answer.
         for attempt in reversed(self.attempts):
             if attempt.assessment is None:
                 return attempt
@@ -99,31 +153,54 @@ class SessionQuestion:
         attempt: AnswerAttempt,
         assessment: AnswerAssessment
     ) -> None:
-        index = self.attempts.index(attempt)
-        self.attempts[index] = AnswerAttempt(
-            user_answer=attempt.user_answer,
-            answered_at=attempt.answered_at,
-            assessment=assessment,
-        )
+        # Identity scan from the tail: the assessed attempt is almost always
+        # the latest one, and a pointer compare per element avoids the
+        # field-by-field __eq__ that list.index performs.
+        attempts = self.attempts
+        for index in range(len(attempts) - 1, -1, -1):
+            if attempts[index] is attempt:
+                break
+        else:
+            # Equal-but-distinct attempt object; fall back to equality.
+            index = attempts.index(attempt)
+        # In-place update: no replacement attempt is allocated. Compare the
+        # head against the stored attempt, not the caller's object: on the
+        # equality-fallback path they are distinct, and the head must still
+        # be cleared or it would keep serving an already-assessed attempt.
+        attempts[index].assessment = assessment
+        if attempts[index] is self._unassessed_head:
+            self._unassessed_head = None
+        # The outcome is known right here, so precompute the cached status
+        # and the next read is a plain attribute load with no scan. Test
+        # doubles may pass a stand-in assessment; those fall back to the
+        # lazy scan.
+        if isinstance(assessment, AnswerAssessment):
+            self._status = _CORRECT if assessment.is_correct else _INCORRECT
+        else:
+            self._status = None
 
     @property
     def status(self) -> QuestionStatus:
-        if not self.attempts:
-            return QuestionStatus.PENDING
+        # Serve the memoized result; submitting a new (unassessed) attempt
+        # cannot change the outcome of the scan, so only attach_assessment
+        # invalidates it.
+        if self._status is not None:
+            return self._status
 
+        status = _PENDING
         # Use last assessed attempt
         for attempt in reversed(self.attempts):
             if attempt.assessment is not None:
-                return (
-                    QuestionStatus.CORRECT
-                    if attempt.assessment.is_correct
-                    else QuestionStatus.INCORRECT
+                status = (
+                    _CORRECT if attempt.assessment.is_correct else _INCORRECT
                 )
+                break
 
-        return QuestionStatus.PENDING
+        self._status = status
+        return status
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssessmentFeedback:
     """
     User feedback on a question assessment.
@@ -151,10 +228,10 @@ class AssessmentFeedback:
     session_id: str
     score: int
     comment: str | None = None
-    submitted_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    submitted_at: datetime = field(default_factory=partial(datetime.now, UTC))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuestionFeedback:
     """User feedback on the quality of a question."""
 
@@ -166,4 +243,4 @@ class QuestionFeedback:
 
     is_helpful: bool
 
-    submitted_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    submitted_at: datetime = field(default_factory=partial(datetime.now, UTC))
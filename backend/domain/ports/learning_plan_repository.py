@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
 
-from domain.entities.learning import LearningPlan
+from domain.entities.learning import LearningPlan, StudySession
+from domain.entities.question import SessionQuestion
 
 
 class LearningPlanRepository(ABC):
@@ -35,9 +36,96 @@ class LearningPlanRepository(ABC):
         pass
 
     @abstractmethod
-    def list_active(self) -> List[LearningPlan]:
+    def get_session(
+        self, plan_id: str, session_id: str
+    ) -> Optional[StudySession]:
         """
-        List all active (non-completed) learning plans.
+        Retrieve a single StudySession without hydrating the whole plan.
+
+        Implementations backed by a datastore should issue a targeted query
+        for the one session instead of loading every session of the
+        aggregate and discarding all but one.
+        """
+        pass
+
+    @abstractmethod
+    def add_session(self, plan_id: str, session: StudySession) -> None:
+        """
+        Attach a new StudySession to a plan with a targeted insert.
+
+        Avoids re-writing the whole aggregate (and every historical
+        session) just to record one new session.
+        """
+        pass
+
+    @abstractmethod
+    def save_session(self, plan_id: str, session: StudySession) -> None:
+        """
+        Persist a single mutated StudySession.
+
+        Counterpart of ``get_session`` for the write side: implementations
+        should update only the affected session rows rather than rewriting
+        the entire aggregate.
+        """
+        pass
+
+    @abstractmethod
+    def save_session_question(
+        self, plan_id: str, session_id: str, session_question: SessionQuestion
+    ) -> None:
+        """
+        Persist a single mutated SessionQuestion.
+
+        The finest-grained write: implementations should update just the
+        affected question/attempt rows (single UPDATE, or a JSON-patch style
+        partial write for document stores) instead of re-serializing the
+        session or the whole aggregate.
+        """
+        pass
+
+    @abstractmethod
+    def submit_answer(
+        self,
+        plan_id: str,
+        session_id: str,
+        question_id: str,
+        user_answer,
+    ) -> bool:
+        """
+        Record an answer attempt for one session question in a single call.
+
+        Specialized write for the hottest request shape: implementations
+        backed by a datastore can express it as one statement (append to
+        the attempts of the matching session question). Returns ``True``
+        when the target question was matched and the attempt recorded,
+        ``False`` otherwise — the rowcount analogue callers use to map
+        the miss to the right exception.
+        """
+        pass
+
+    @abstractmethod
+    def list_session_questions_for_ku(
+        self, plan_id: str, knowledge_unit_id: str
+    ) -> List[SessionQuestion]:
+        """
+        All assessed (non-pending) session questions for one knowledge unit.
+
+        Implementations should fetch these in a single filtered query
+        instead of traversing every session of the plan (the classic N+1
+        pattern with lazy ORMs).
+        """
+        pass
+
+    @abstractmethod
+    def list_active(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[LearningPlan]:
+        """
+        List active (non-completed) learning plans, one page at a time.
+
+        Implementations backed by a datastore should push ``limit`` and
+        ``offset`` down into the query instead of hydrating every active
+        plan and slicing in Python.
         """
         pass
 
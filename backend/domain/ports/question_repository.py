@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from domain.entities.question import Question
 
@@ -19,6 +19,20 @@ class QuestionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_many(self, questions: List[Question]) -> None:
+        """
+        Persist several Question entities in a single round-trip.
+
+        Parameters
+        ----------
+        questions : List[Question]
+            The Question entities to be saved. SQL-backed implementations
+            should issue one bulk INSERT instead of one statement per
+            question.
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, question_id: str) -> Optional[Question]:
         """
@@ -36,6 +50,46 @@ class QuestionRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, question_ids: List[str]) -> Dict[str, Question]:
+        """
+        Retrieve several Questions in a single round-trip.
+
+        Parameters
+        ----------
+        question_ids : List[str]
+            The unique identifiers of the Questions to fetch.
+
+        Returns
+        -------
+        Dict[str, Question]
+            A mapping from question ID to Question for every ID that was found.
+            Missing IDs are simply absent from the mapping.
+        """
+        pass
+
+    async def get_many_async(self, question_ids: List[str]) -> Dict[str, Question]:
+        """
+        Asynchronous counterpart of ``get_many``.
+
+        The default implementation simply delegates to the synchronous
+        ``get_many``. Implementations backed by files or network sockets
+        should override this to submit all reads concurrently (e.g. an
+        async DB driver with ``asyncio.gather``) so the N fetches cost
+        roughly one round-trip instead of N.
+
+        Parameters
+        ----------
+        question_ids : List[str]
+            The unique identifiers of the Questions to fetch.
+
+        Returns
+        -------
+        Dict[str, Question]
+            A mapping from question ID to Question for every ID that was found.
+        """
+        return self.get_many(question_ids)
+
     @abstractmethod
     def list_all(self) -> List[Question]:
         """
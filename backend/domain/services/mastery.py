@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import List
 
 from domain.entities.knowledge_unit import KnowledgeUnit
 from domain.entities.question import SessionQuestion, AnswerAssessment
 
+# C-level attribute fetch for the tight per-attempt loop below.
+_get_assessment = attrgetter("assessment")
+
 
 class MasteryService(ABC):
     @abstractmethod
@@ -61,24 +65,26 @@ class QuestionBasedMasteryService(MasteryService):
         max_score = 0.0
 
         for sq in session_questions:
-            assessed_attempts = [
-                a for a in sq.attempts if a.assessment is not None
-            ]
-
-            if not assessed_attempts:
+            # Single pass: count assessed attempts and keep the latest one,
+            # without materializing an intermediate list per question.
+            assessed_count = 0
+            assessment: AnswerAssessment | None = None
+            for attempt in sq.attempts:
+                attempt_assessment = _get_assessment(attempt)
+                if attempt_assessment is not None:
+                    assessed_count += 1
+                    assessment = attempt_assessment
+
+            if assessment is None:
                 continue  # unanswered → no contribution
 
-            latest_attempt = assessed_attempts[-1]
-            assessment: AnswerAssessment = latest_attempt.assessment
-
             max_score += 1.0
 
             if assessment.is_correct:
-                attempts_count = len(assessed_attempts)
-                penalty = max(0.0, 1.0 - 0.2 * (attempts_count - 1))
-                total_score += penalty
-            else:
-                total_score += 0.0
+                # Linear retry penalty, floored at zero
+                penalty = 1.0 - 0.2 * (assessed_count - 1)
+                if penalty > 0.0:
+                    total_score += penalty
 
         if max_score == 0.0:
             return 0.0
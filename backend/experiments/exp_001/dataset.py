@@ -1,10 +1,8 @@
-import uuid
-
 from domain.entities.document import Document
 
 DOCUMENTS_DATASET = [
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_01",
         text=(
             "The company faced declining revenue for three consecutive quarters. "
             "During the same period, customer churn increased while marketing spend remained flat. "
@@ -12,7 +10,7 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_02",
         text=(
             "The river flooded the surrounding farmland after unusually heavy rainfall upstream. "
             "Because the levees had not been reinforced since their construction decades earlier, "
@@ -20,14 +18,14 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_03",
         text=(
             "The experiment was repeated under identical conditions, except that the temperature was lowered by five degrees. "
             "Only in the lower-temperature trials did the compound crystallize, suggesting temperature was a necessary condition for crystallization."
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_04",
         text=(
             "The city expanded public transit access to underserved neighborhoods. "
             "Within a year, employment rates in those areas increased. "
@@ -35,7 +33,7 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_05",
         text=(
             "The software update reduced memory usage but introduced longer load times. "
             "User complaints shifted from application crashes to performance delays, "
@@ -43,7 +41,7 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_06",
         text=(
             "Initially, the policy aimed to reduce emissions through voluntary compliance. "
             "After emissions remained unchanged, enforcement mechanisms were added. "
@@ -51,14 +49,14 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_07",
         text=(
             "The historian notes that the state lacked natural defenses and had limited military resources. "
             "Surrounded by rival powers, it sought security through diplomatic alliances rather than territorial expansion."
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_08",
         text=(
             "The study group that met weekly showed steady improvement in test scores. "
             "A control group studying individually showed no comparable gains. "
@@ -66,7 +64,7 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_09",
         text=(
             "When raw material costs increased, the manufacturer raised prices. "
             "Sales volume subsequently declined, but total revenue remained stable, "
@@ -74,21 +72,21 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_10",
         text=(
             "The startup prioritized rapid user growth over immediate profitability. "
             "Although losses accumulated initially, the expanded user base later enabled successful monetization."
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_11",
         text=(
             "The region depended heavily on agriculture, which suffered during prolonged drought. "
             "As crop yields fell, food prices rose, leading to increased migration to urban areas."
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_12",
         text=(
             "The algorithm performed well on training data but poorly on unseen examples. "
             "After reducing model complexity, performance on new data improved, "
@@ -96,7 +94,7 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_13",
         text=(
             "The organization decentralized decision-making authority. "
             "Teams responded faster to market changes, but inconsistencies across regions increased, "
@@ -104,14 +102,14 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_14",
         text=(
             "Because funding was delayed, the infrastructure project missed its initial deadlines. "
             "Compressed timelines later increased costs due to expedited labor and materials."
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_15",
         text=(
             "The novel was initially criticized for its unconventional structure. "
             "Over time, academic analysis reframed those same features as innovative, "
@@ -119,14 +117,14 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_16",
         text=(
             "The country faced international sanctions that limited access to foreign capital. "
             "Domestic industries expanded to compensate, resulting in reduced reliance on imports."
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_17",
         text=(
             "The teacher replaced lectures with problem-based learning. "
             "Although students struggled at first, long-term retention improved, "
@@ -134,21 +132,21 @@ DOCUMENTS_DATASET = [
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_18",
         text=(
             "After automating routine tasks, the company reduced staffing levels. "
             "Remaining employees focused on higher-value work, increasing overall productivity."
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_19",
         text=(
             "The ecosystem lost its top predator due to overhunting. "
             "Herbivore populations expanded unchecked, leading to vegetation decline."
         ),
     ),
     Document(
-        id=str(uuid.uuid4()),
+        id="doc_20",
         text=(
             "Early reports underestimated the severity of the outbreak due to limited testing. "
             "As testing capacity expanded, case counts rose sharply without a corresponding increase in mortality rate."
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional
 
 from opik import Opik, Prompt
@@ -13,13 +14,18 @@ class OpikPromptFactory:
         """Initialize Opik client if not provided."""
         if self.opik_client is None:
             self.opik_client = Opik()
+        # Constructing a Prompt upserts the template to the Opik backend;
+        # memoizing per template content makes that a one-time round-trip
+        # instead of one per document processed.
+        self._prompt_for = lru_cache(maxsize=8)(self._make_prompt)
 
-    def build(self, template: str, template_arguments: Dict) -> str:
+    def _make_prompt(self, template: str) -> Prompt:
         # This saves the prompt template to Opik if not already present
-        opik_prompt = Prompt(
+        return Prompt(
             name=self.opik_template_name,
             prompt=template,
             metadata={"environment": "laboratory"}
         )
 
-        return opik_prompt.format(**template_arguments)
\ No newline at end of file
+    def build(self, template: str, template_arguments: Dict) -> str:
+        return self._prompt_for(template).format(**template_arguments)
@@ -1,5 +1,8 @@
+import textwrap
 
-TEMPLATE_V1 = """
+# Dedented once at import: the 4-space indentation on every line is
+# pure formatting, but the model bills it as input tokens on each call.
+TEMPLATE_V1 = textwrap.dedent("""
     You are an expert at reading a text and breaking it down into discrete, verifiable claims and knowledge units.
 
     You will extract three types of information:
@@ -65,4 +68,4 @@ TEMPLATE_V1 = """
 
     TEXT:
     "{{document_text}}"
-    """
\ No newline at end of file
+    """)
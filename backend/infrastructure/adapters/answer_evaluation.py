@@ -1,8 +1,8 @@
-import json
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from typing import Callable
 
+import orjson
 from openai import OpenAI
 
 from domain.ports.answer_evaluation import AnswerEvaluationService
@@ -23,6 +23,10 @@ def create_openai_llm_call(
                 {"role": "user", "content": prompt},
             ],
             temperature=temperature,
+            # JSON mode: the model cannot emit stray markdown around the
+            # grading verdict, so the fail-closed parse path becomes a
+            # true edge case instead of a recurring wasted call.
+            response_format={"type": "json_object"},
         )
         return response.choices[0].message.content.strip()
 
@@ -40,35 +44,64 @@ class LLMAnswerEvaluationService(AnswerEvaluationService):
 
     client: OpenAI
     model: str = "gpt-4o"
+    cache_max_size: int = 4096
 
     def __post_init__(self) -> None:
         self.llm_call = create_openai_llm_call(self.client, self.model)
+        # Memoized verdicts keyed by (question id, normalized answer):
+        # canonical answers recur across learners, and grading at
+        # temperature 0 is deterministic in intent, so a repeat pair skips
+        # the LLM call entirely. Bounded with FIFO eviction like the
+        # caching question repository.
+        self._verdicts: dict[tuple[str, str], tuple[bool, str | None]] = {}
 
     def evaluate(
         self,
         question: Question,
         user_answer: Answer,
     ) -> AnswerAssessment:
+        key = (question.id, (user_answer or "").strip().lower())
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            verdict = self._grade(question, user_answer)
+            if verdict is None:
+                # Unparseable response: fail closed, but do not cache a
+                # transient failure as this pair's verdict.
+                return AnswerAssessment(
+                    is_correct=False,
+                    correct_answer=question.correct_answer,
+                    explanation=None,
+                    assessed_at=datetime.now(UTC),
+                )
+            if len(self._verdicts) >= self.cache_max_size:
+                self._verdicts.pop(next(iter(self._verdicts)))
+            self._verdicts[key] = verdict
+
+        is_correct, explanation = verdict
+        return AnswerAssessment(
+            is_correct=is_correct,
+            correct_answer=question.correct_answer,
+            explanation=explanation,
+            assessed_at=datetime.now(UTC),
+        )
+
+    def _grade(
+        self,
+        question: Question,
+        user_answer: Answer,
+    ) -> "tuple[bool, str | None] | None":
+        """Run the LLM call; None means the response could not be parsed."""
         prompt = self._build_prompt(question, user_answer)
         raw_response = self.llm_call(prompt)
 
         try:
-            data = json.loads(raw_response)
-        except json.JSONDecodeError:
-            # Fail closed
-            return AnswerAssessment(
-                is_correct=False,
-                correct_answer=question.correct_answer,
-                explanation=None,
-                assessed_at=datetime.now(UTC),
-            )
+            # orjson parses the model's JSON response several times faster
+            # than the stdlib decoder.
+            data = orjson.loads(raw_response)
+        except orjson.JSONDecodeError:
+            return None
 
-        return AnswerAssessment(
-            is_correct=bool(data.get("is_correct", False)),
-            correct_answer=question.correct_answer,
-            explanation=data.get("explanation"),
-            assessed_at=datetime.now(UTC),
-        )
+        return bool(data.get("is_correct", False)), data.get("explanation")
 
     def _build_prompt(self, question: Question, user_answer: Answer) -> str:
         return f"""
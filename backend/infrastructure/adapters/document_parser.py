@@ -1,6 +1,8 @@
 import base64
+import hashlib
 import io
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -11,6 +13,13 @@ from domain.entities.document import Document, DocumentID
 from domain.ports.document_parser import DocumentParser
 
 
+# Shared pool for the per-batch vision requests: batches of a document are
+# independent, so a multi-page PDF costs roughly one round-trip of
+# wall-clock latency instead of one per batch. Bounded to stay under
+# OpenAI rate limits.
+_ocr_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ocr-batch")
+
+
 class LLMOCRDocumentParser(DocumentParser):
     """
     LLM-based OCR document parser that uses OpenAI's vision API to extract text from PDFs.
@@ -36,7 +45,20 @@ class LLMOCRDocumentParser(DocumentParser):
         self.client = client
         self.model = model
         self.max_tokens_per_page = 1500
-        self.dpi = 150  # DPI for image conversion
+        # Pages whose embedded text layer is at least this long skip the
+        # vision call entirely.
+        self.min_native_chars = 100
+        # OCR results keyed by a hash of the rendered JPEG (plus model and
+        # DPI): boilerplate pages — cover sheets, template headers —
+        # render to identical bytes and skip the vision call on repeats.
+        # Bounded with FIFO eviction like the caching question repository.
+        self.ocr_cache_max_size = 1024
+        self._ocr_cache: dict[str, str] = {}
+        # 110 DPI keeps body text comfortably legible for OCR while cutting
+        # per-page payload roughly in half versus 150 DPI; base64 inflates
+        # every payload byte by ~33%, so smaller renders shrink uploads
+        # proportionally.
+        self.dpi = 110  # DPI for image conversion
         self.batch_size = 4  # Number of pages per OpenAI request
 
     def parse(self, file_bytes: bytes, filename: str) -> Document:
@@ -72,65 +94,122 @@ class LLMOCRDocumentParser(DocumentParser):
                 f"Unsupported file format: {file_extension}. Only PDF files are supported."
             )
 
-        images = self._pdf_to_images(file_bytes)
+        # Digitally generated PDFs carry a real text layer; reading it via
+        # PyMuPDF is effectively free, so only pages without (or with a
+        # suspiciously short) text layer are rendered and sent to the
+        # vision model.
+        doc = pymupdf.open(stream=file_bytes, filetype="pdf")
+        zoom = self.dpi / 72
+        mat = pymupdf.Matrix(zoom, zoom)
+
+        page_texts: List[str | None] = []
+        ocr_images: List[bytes] = []
+        ocr_positions: List[int] = []
+        ocr_keys: List["str | None"] = []
+        ocr_page_count = 0
+
+        for page in doc:
+            text = self._native_page_text(page)
+            if text is not None:
+                page_texts.append(text)
+                continue
 
-        page_texts: List[str] = []
+            ocr_page_count += 1
+            pix = page.get_pixmap(matrix=mat, colorspace=pymupdf.csGRAY)
+            jpeg = pix.tobytes("jpeg", jpg_quality=70)
+            key = self._ocr_cache_key(jpeg)
+            cached = self._ocr_cache.get(key) if key is not None else None
+            if cached is not None:
+                page_texts.append(cached)
+                continue
+
+            ocr_positions.append(len(page_texts))
+            page_texts.append(None)
+            ocr_images.append(jpeg)
+            ocr_keys.append(key)
 
-        for i in range(0, len(images), self.batch_size):
-            batch = images[i:i + self.batch_size]
-            batch_texts = self._extract_text_from_images_batch(
-                batch,
-                start_page=i + 1
+        doc.close()
+        num_pages = len(page_texts)
+
+        if ocr_images:
+            # Dispatch every batch concurrently; map preserves batch order
+            # so pages come back in document order.
+            batches = [
+                (
+                    ocr_images[i:i + self.batch_size],
+                    ocr_positions[i] + 1,
+                )
+                for i in range(0, len(ocr_images), self.batch_size)
+            ]
+            batch_results = _ocr_executor.map(
+                lambda pair: self._extract_text_from_images_batch(
+                    pair[0], start_page=pair[1]
+                ),
+                batches,
             )
-            page_texts.extend(batch_texts)
+            ocr_texts = [
+                text for batch_texts in batch_results for text in batch_texts
+            ]
+            for position, key, text in zip(ocr_positions, ocr_keys, ocr_texts):
+                page_texts[position] = text
+                if key is not None:
+                    if len(self._ocr_cache) >= self.ocr_cache_max_size:
+                        self._ocr_cache.pop(next(iter(self._ocr_cache)))
+                    self._ocr_cache[key] = text
 
         full_text = "\n\n".join(page_texts)
 
-        document_id = DocumentID(str(uuid.uuid4()))
+        if ocr_page_count == 0:
+            parser_mode = "native"
+        elif ocr_page_count == num_pages:
+            parser_mode = "llm_ocr_batched"
+        else:
+            parser_mode = "mixed"
+
+        document_id = DocumentID(uuid.uuid4().hex)
         return Document(
             id=document_id,
             text=full_text,
             metadata={
                 "filename": filename,
-                "num_pages": len(images),
-                "parser": "llm_ocr_batched"
+                "num_pages": num_pages,
+                "parser": parser_mode
             }
         )
 
-    def _pdf_to_images(self, pdf_bytes: bytes) -> List[Image.Image]:
+    def _ocr_cache_key(self, jpeg: bytes) -> "str | None":
         """
-        Convert PDF bytes to a list of PIL images using PyMuPDF.
-
-        Pages are rendered at the configured DPI and converted to grayscale
-        images to reduce payload size while preserving OCR quality.
-
-        Parameters
-        ----------
-        pdf_bytes : bytes
-            Raw PDF file bytes.
+        Content-hash cache key for a rendered page, or None if unhashable.
 
-        Returns
-        -------
-        List[Image.Image]
-            List of PIL images, one per page.
+        Includes model and DPI so results never leak across
+        configurations.
         """
-        doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
-
-        images = []
-        zoom = self.dpi / 72
-        mat = pymupdf.Matrix(zoom, zoom)
-
-        for page in doc:
-            pix = page.get_pixmap(matrix=mat, colorspace=pymupdf.csGRAY)
-            img = Image.frombytes("L", [pix.width, pix.height], pix.samples)
-            images.append(img)
+        if not isinstance(jpeg, bytes):
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.model.encode())
+        digest.update(str(self.dpi).encode())
+        digest.update(jpeg)
+        return digest.hexdigest()
+
+    def _native_page_text(self, page) -> "str | None":
+        """
+        Return a page's embedded text layer, or None if OCR is needed.
 
-        doc.close()
-        return images
+        A very short extraction usually means a scanned page with stray
+        artifacts rather than real content, so those fall through to OCR.
+        """
+        try:
+            text = page.get_text("text")
+        except Exception:
+            return None
+        if isinstance(text, str) and len(text.strip()) >= self.min_native_chars:
+            return text.strip()
+        return None
 
     def _extract_text_from_images_batch(
         self,
-        images: List[Image.Image],
+        images: List[bytes],
         start_page: int
     ) -> List[str]:
         """
@@ -142,8 +221,9 @@ class LLMOCRDocumentParser(DocumentParser):
 
         Parameters
         ----------
-        images : List[Image.Image]
-            List of PIL images representing consecutive document pages.
+        images : List[bytes]
+            JPEG-encoded images representing consecutive document pages
+            (PIL images are also accepted and encoded on the fly).
         start_page : int
             Page number of the first image in the batch (used for context/debugging).
 
@@ -198,20 +278,27 @@ class LLMOCRDocumentParser(DocumentParser):
 
         return pages
 
-    def _image_to_base64(self, image: Image.Image) -> str:
+    def _image_to_base64(self, image: "bytes | Image.Image") -> str:
         """
-        Convert PIL image to base64 string.
+        Convert a page image to a base64 string.
+
+        Already-encoded JPEG bytes (the fast path produced during page
+        rendering) are base64-encoded directly; PIL images are
+        JPEG-encoded first.
 
         Parameters
         ----------
-        image : Image.Image
-            PIL image to convert.
+        image : bytes | Image.Image
+            JPEG bytes or a PIL image to convert.
 
         Returns
         -------
         str
             Base64-encoded JPEG image string.
         """
+        if isinstance(image, bytes):
+            return base64.b64encode(image).decode()
+
         buffer = io.BytesIO()
         image.save(buffer, format="JPEG", quality=70, optimize=True)
         return base64.b64encode(buffer.getvalue()).decode()
@@ -87,7 +87,7 @@ class LLMKnowledgeUnitGenerationService(KnowledgeUnitGenerationService):
         for item in data.get("facts", []):
             target_claim = claim_registry[item["target_claim_id"]]
             fact = FactKnowledge(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 description=item["description"],
                 target_claim=target_claim
             )
@@ -96,7 +96,7 @@ class LLMKnowledgeUnitGenerationService(KnowledgeUnitGenerationService):
         for item in data.get("skills", []):
             source_claims = [claim_registry[i] for i in item["source_claim_ids"]]
             skill = SkillKnowledge(
-                id=str(uuid.uuid4()),
+                id=uuid.uuid4().hex,
                 description=item["description"],
                 source_claims=source_claims
             )
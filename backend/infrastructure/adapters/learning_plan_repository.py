@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Dict, Optional, List
 
-from domain.entities.learning import LearningPlan
+from domain.entities.learning import LearningPlan, StudySession
+from domain.entities.question import SessionQuestion, QuestionStatus
 from domain.ports.learning_plan_repository import LearningPlanRepository
 
 
@@ -30,18 +32,203 @@ class InMemoryLearningPlanRepository(LearningPlanRepository):
         """
         return self._plans.get(plan_id)
 
-    def list_active(self) -> List[LearningPlan]:
+    def get_session(
+        self, plan_id: str, session_id: str
+    ) -> Optional[StudySession]:
         """
-        List all non-completed LearningPlans.
+        Retrieve a single StudySession from its plan.
         """
+        plan = self._plans.get(plan_id)
+        if plan is None:
+            return None
+        return plan.get_session(session_id)
+
+    def add_session(self, plan_id: str, session: StudySession) -> None:
+        """
+        Attach a new StudySession to a stored plan.
+        """
+        plan = self._plans.get(plan_id)
+        if plan is not None:
+            plan.add_session(session)
+
+    def save_session(self, plan_id: str, session: StudySession) -> None:
+        """
+        Persist a single mutated StudySession.
+
+        Aggregates are stored by reference, so in-place session mutations
+        are already visible; a DB-backed implementation would issue a
+        partial UPDATE of the affected rows here.
+        """
+        pass
+
+    def save_session_question(
+        self, plan_id: str, session_id: str, session_question: SessionQuestion
+    ) -> None:
+        """
+        Persist a single mutated SessionQuestion.
+
+        Stored by reference, so the mutation is already visible; a
+        DB-backed implementation would update just the affected rows here.
+        """
+        pass
+
+    def submit_answer(
+        self,
+        plan_id: str,
+        session_id: str,
+        question_id: str,
+        user_answer,
+    ) -> bool:
+        """
+        Record an answer attempt on the matching session question.
+        """
+        plan = self._plans.get(plan_id)
+        if plan is None:
+            return False
+        session = plan.get_session(session_id)
+        if session is None:
+            return False
+        session_question = session.questions.get(question_id)
+        if session_question is None:
+            return False
+        session_question.submit_answer(user_answer)
+        return True
+
+    def list_session_questions_for_ku(
+        self, plan_id: str, knowledge_unit_id: str
+    ) -> List[SessionQuestion]:
+        """
+        All assessed session questions for one knowledge unit.
+        """
+        plan = self._plans.get(plan_id)
+        if plan is None:
+            return []
         return [
+            sq
+            for sq in plan.session_questions_for_ku(knowledge_unit_id)
+            if sq.status != QuestionStatus.PENDING
+        ]
+
+    def list_active(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[LearningPlan]:
+        """
+        List non-completed LearningPlans, applying the requested page
+        lazily so plans past the window are never materialized.
+        """
+        active = (
             plan
             for plan in self._plans.values()
             if not plan.is_completed()
-        ]
+        )
+        stop = None if limit is None else offset + limit
+        return list(islice(active, offset, stop))
 
     def delete(self, plan_id: str) -> None:
         """
         Delete a LearningPlan and all owned state.
         """
         self._plans.pop(plan_id, None)
+
+
+@dataclass
+class IdentityMapLearningPlanRepository(LearningPlanRepository):
+    """
+    Identity-map decorator over another LearningPlanRepository.
+
+    Coalesces duplicate ``get_by_id`` calls into one fetch so middleware
+    and multiple use cases touching the same plan within a request do not
+    re-hydrate the aggregate. Writes go through to the decoratee and keep
+    the map coherent. With a datastore-backed repository this should be
+    bound request-scoped; with the in-memory store, plans are shared by
+    reference so the map stays coherent process-wide.
+    """
+    _inner: LearningPlanRepository
+    _cache: Dict[str, LearningPlan] = field(default_factory=dict)
+
+    def save(self, plan: LearningPlan) -> None:
+        """
+        Persist the aggregate and refresh the cached instance.
+        """
+        self._inner.save(plan)
+        self._cache[plan.id] = plan
+
+    def get_by_id(self, plan_id: str) -> Optional[LearningPlan]:
+        """
+        Retrieve a LearningPlan, short-circuiting on a cache hit.
+        """
+        plan = self._cache.get(plan_id)
+        if plan is None:
+            plan = self._inner.get_by_id(plan_id)
+            if plan is not None:
+                self._cache[plan_id] = plan
+        return plan
+
+    def get_session(
+        self, plan_id: str, session_id: str
+    ) -> Optional[StudySession]:
+        """
+        Retrieve a session, served from the cached plan when available.
+        """
+        plan = self._cache.get(plan_id)
+        if plan is not None:
+            return plan.get_session(session_id)
+        return self._inner.get_session(plan_id, session_id)
+
+    def add_session(self, plan_id: str, session: StudySession) -> None:
+        """
+        Attach a new StudySession via the decoratee.
+        """
+        self._inner.add_session(plan_id, session)
+
+    def save_session(self, plan_id: str, session: StudySession) -> None:
+        """
+        Persist a single mutated StudySession via the decoratee.
+        """
+        self._inner.save_session(plan_id, session)
+
+    def save_session_question(
+        self, plan_id: str, session_id: str, session_question: SessionQuestion
+    ) -> None:
+        """
+        Persist a single mutated SessionQuestion via the decoratee.
+        """
+        self._inner.save_session_question(plan_id, session_id, session_question)
+
+    def submit_answer(
+        self,
+        plan_id: str,
+        session_id: str,
+        question_id: str,
+        user_answer,
+    ) -> bool:
+        """
+        Delegate the specialized answer write; no map upkeep is needed
+        since cached plans share the mutated session by reference.
+        """
+        return self._inner.submit_answer(
+            plan_id, session_id, question_id, user_answer
+        )
+
+    def list_session_questions_for_ku(
+        self, plan_id: str, knowledge_unit_id: str
+    ) -> List[SessionQuestion]:
+        """
+        Delegate the filtered session-question fetch.
+        """
+        return self._inner.list_session_questions_for_ku(plan_id, knowledge_unit_id)
+
+    def list_active(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[LearningPlan]:
+        """
+        Delegate to the underlying store; listing is not cached.
+        """
+        return self._inner.list_active(limit=limit, offset=offset)
+
+    def delete(self, plan_id: str) -> None:
+        """
+        Delete a plan and drop it from the identity map.
+        """
+        self._inner.delete(plan_id)
+        self._cache.pop(plan_id, None)
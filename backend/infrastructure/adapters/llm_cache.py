@@ -0,0 +1,57 @@
+import hashlib
+import logging
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+def cached_llm_call(
+    llm_call: Callable[..., str],
+    *,
+    model: str,
+    template_version: str = "",
+    cache_dir: str = ".llm_cache",
+) -> Callable[..., str]:
+    """Wrap an ``llm_call`` with a content-hash keyed disk cache.
+
+    Responses are stored one file per key under ``cache_dir``, keyed by
+    sha256 over (model, template_version, temperature, prompt). At
+    temperature 0 calls are deterministic in intent, so replaying an
+    experiment with unchanged inputs and template skips the paid OpenAI
+    round-trip entirely. Bump ``template_version`` whenever the prompt
+    template changes to invalidate stale entries.
+
+    Parameters
+    ----------
+    llm_call: Callable[..., str]
+        The underlying call taking ``(prompt, temperature=0.0)``.
+    model: str
+        Model name, part of the cache key.
+    template_version: str
+        Version label of the prompt template, part of the cache key.
+    cache_dir: str
+        Directory holding the cached responses; created if missing.
+
+    Returns
+    -------
+    Callable[..., str]
+        A drop-in replacement for ``llm_call``.
+    """
+    cache_path = Path(cache_dir)
+    cache_path.mkdir(parents=True, exist_ok=True)
+
+    def wrapped(prompt: str, temperature: float = 0.0) -> str:
+        key = hashlib.sha256(
+            f"{model}\x00{template_version}\x00{temperature}\x00{prompt}".encode()
+        ).hexdigest()
+        entry = cache_path / f"{key}.txt"
+        if entry.exists():
+            logger.debug("[cached_llm_call] Cache hit for key %s", key)
+            return entry.read_text(encoding="utf-8")
+
+        response = llm_call(prompt, temperature)
+        entry.write_text(response, encoding="utf-8")
+        return response
+
+    return wrapped
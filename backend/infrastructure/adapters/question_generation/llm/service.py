@@ -5,7 +5,7 @@ import uuid
 import json
 
 from domain.entities.knowledge_unit import KnowledgeUnit, FactKnowledge, SkillKnowledge
-from domain.entities.question import Question, Difficulty, Answer
+from domain.entities.question import Question, Answer, make_difficulty
 from domain.ports.question_generation import QuestionGenerationService
 from infrastructure.adapters.answer_evaluation import create_openai_llm_call
 from infrastructure.adapters.question_generation.llm.prompts import build_question_creation_prompt
@@ -56,10 +56,10 @@ class LLMQuestionGenerationService(QuestionGenerationService):
 
         # --- 4. Construct Question ---
         question = Question(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             text=question_text,
             correct_answer=Answer(answer_text),
-            difficulty=Difficulty(level=difficulty_level),
+            difficulty=make_difficulty(level=difficulty_level),
             knowledge_unit_id=ku.id
         )
 
@@ -105,10 +105,10 @@ class LLMQuestionGenerationService(QuestionGenerationService):
         for q_data in questions_data[:max_count]:  # Ensure we don't exceed requested count
             try:
                 question = Question(
-                    id=str(uuid.uuid4()),
+                    id=uuid.uuid4().hex,
                     text=q_data["question_text"],
                     correct_answer=Answer(q_data["answer"]),
-                    difficulty=Difficulty(level=q_data.get("difficulty_level", 2)),
+                    difficulty=make_difficulty(level=q_data.get("difficulty_level", 2)),
                     knowledge_unit_id=ku.id
                 )
                 questions.append(question)
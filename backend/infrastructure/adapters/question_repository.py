@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Optional, List
 
 from domain.entities.question import Question
@@ -21,14 +21,108 @@ class InMemoryQuestionRepository(QuestionRepository):
         """
         self._questions[question.id] = question
 
+    def save_many(self, questions: List[Question]) -> None:
+        """
+        Persist several Question entities in one pass.
+        """
+        self._questions.update((question.id, question) for question in questions)
+
     def get_by_id(self, question_id: str) -> Optional[Question]:
         """
         Retrieve a Question by its ID.
         """
         return self._questions.get(question_id)
 
+    def get_many(self, question_ids: List[str]) -> Dict[str, Question]:
+        """
+        Retrieve several Questions in a single lookup pass.
+        """
+        return {
+            question_id: self._questions[question_id]
+            for question_id in question_ids
+            if question_id in self._questions
+        }
+
     def list_all(self) -> List[Question]:
         """
         List all Question entities.
         """
         return list(self._questions.values())
+
+
+@dataclass
+class CachingQuestionRepository(QuestionRepository):
+    """
+    Identity-map decorator over another QuestionRepository.
+
+    Repeated ``get_by_id``/``get_many`` calls return the already-fetched
+    instances without re-querying the underlying store — useful when the
+    same questions are pulled multiple times while serving one request
+    (e.g. assessment followed by a view build). ``save`` keeps the cache
+    coherent with the store.
+
+    The cache is bounded: once ``max_size`` entries are held, the oldest
+    entry is evicted before a new one is admitted, so a long-lived process
+    serving many sessions cannot grow it without limit.
+    """
+    _inner: QuestionRepository
+    _cache: Dict[str, Question] = field(default_factory=dict)
+    max_size: int = 4096
+
+    def _admit(self, question_id: str, question: Question) -> None:
+        if len(self._cache) >= self.max_size and question_id not in self._cache:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[question_id] = question
+
+    def save(self, question: Question) -> None:
+        """
+        Persist a Question entity and refresh the cached instance.
+        """
+        self._inner.save(question)
+        self._admit(question.id, question)
+
+    def save_many(self, questions: List[Question]) -> None:
+        """
+        Persist several Questions in one round-trip, refreshing the cache.
+        """
+        self._inner.save_many(questions)
+        for question in questions:
+            self._admit(question.id, question)
+
+    def get_by_id(self, question_id: str) -> Optional[Question]:
+        """
+        Retrieve a Question, short-circuiting on a cache hit.
+        """
+        question = self._cache.get(question_id)
+        if question is None:
+            question = self._inner.get_by_id(question_id)
+            if question is not None:
+                self._admit(question_id, question)
+        return question
+
+    def get_many(self, question_ids: List[str]) -> Dict[str, Question]:
+        """
+        Retrieve several Questions, fetching only the cache misses.
+        """
+        found: Dict[str, Question] = {}
+        missing: List[str] = []
+        for question_id in question_ids:
+            question = self._cache.get(question_id)
+            if question is None:
+                missing.append(question_id)
+            else:
+                found[question_id] = question
+
+        if missing:
+            fetched = self._inner.get_many(missing)
+            for question_id, question in fetched.items():
+                self._admit(question_id, question)
+            found.update(fetched)
+
+        return found
+
+    def list_all(self) -> List[Question]:
+        """
+        List all Question entities from the underlying store.
+        """
+        return self._inner.list_all()
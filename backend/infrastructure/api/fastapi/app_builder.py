@@ -60,6 +60,9 @@ class AppBuilder:
         app.get("/learning-plans/{learning_plan_id}/sessions/{session_id}")(
             self.get_study_session_api.get_study_session
         )
+        app.get("/learning-plans/{learning_plan_id}/sessions/{session_id}/progress")(
+            self.get_study_session_api.get_study_session_progress
+        )
 
     def register_health_routes(self, app: FastAPI) -> None:
         """Register health check routes."""
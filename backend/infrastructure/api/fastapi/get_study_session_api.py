@@ -2,7 +2,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 from application.use_cases.get_study_session import GetStudySessionViewUseCase
-from application.dto.study_session_view import StudySessionView
+from application.dto.study_session_view import (
+    StudySessionView,
+    StudySessionProgressView,
+)
 
 
 class GetStudySessionAPIBase(ABC):
@@ -13,6 +16,11 @@ class GetStudySessionAPIBase(ABC):
         """Get a study session view."""
         pass
 
+    @abstractmethod
+    async def get_study_session_progress(self, learning_plan_id: str, session_id: str) -> StudySessionProgressView:
+        """Get a lightweight progress view of a study session."""
+        pass
+
 
 @dataclass
 class GetStudySessionAPIImpl(GetStudySessionAPIBase):
@@ -25,3 +33,10 @@ class GetStudySessionAPIImpl(GetStudySessionAPIBase):
             learning_plan_id=learning_plan_id,
             study_session_id=session_id,
         )
+
+    async def get_study_session_progress(self, learning_plan_id: str, session_id: str) -> StudySessionProgressView:
+        """Get study session progress endpoint implementation."""
+        return self.get_study_session_use_case.execute_progress(
+            learning_plan_id=learning_plan_id,
+            study_session_id=session_id,
+        )
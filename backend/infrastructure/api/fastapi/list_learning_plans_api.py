@@ -3,8 +3,7 @@ from dataclasses import dataclass
 from typing import List
 
 from application.use_cases.list_learning_plans import ListLearningPlansUseCase
-from domain.entities.learning import LearningPlan
-from domain.entities.question import QuestionStatus
+from application.dto.learning_plan_summary import LearningPlanSummary
 
 
 class ListLearningPlansAPIBase(ABC):
@@ -23,37 +22,31 @@ class ListLearningPlansAPIImpl(ListLearningPlansAPIBase):
 
     async def list_learning_plans(self) -> List[dict]:
         """List all active learning plans endpoint implementation."""
-        plans: List[LearningPlan] = self.list_learning_plans_use_case.execute()
-
-        result = []
-        for plan in plans:
-            # Calculate average mastery across all knowledge units
-            if plan.knowledge_units:
-                avg_mastery = sum(ku.mastery_level for ku in plan.knowledge_units) / len(plan.knowledge_units)
-            else:
-                avg_mastery = 0.0
-
-            # Find incomplete sessions (sessions without ended_at)
-            incomplete_sessions = [
-                {
-                    "session_id": s.id,
-                    "questions_answered": sum(1 for q in s.questions.values() if q.status != QuestionStatus.PENDING),
-                    "total_questions": len(s.questions),
-                    "max_questions": s.max_questions,
-                    "started_at": s.started_at.isoformat(),
-                }
-                for s in plan.sessions
-                if not s.is_completed()
-            ]
-
-            result.append({
-                "learning_plan_id": str(plan.id),
-                "knowledge_unit_count": len(plan.knowledge_units),
-                "average_mastery": round(avg_mastery, 3),
-                "created_at": plan.created_at.isoformat(),
-                "completed_at": plan.completed_at.isoformat() if plan.completed_at else None,
-                "session_count": len(plan.sessions),
-                "incomplete_sessions": incomplete_sessions,
-            })
-
-        return result
+        summaries: List[LearningPlanSummary] = (
+            self.list_learning_plans_use_case.execute()
+        )
+
+        return [
+            {
+                "learning_plan_id": summary.learning_plan_id,
+                "knowledge_unit_count": summary.knowledge_unit_count,
+                "average_mastery": round(summary.average_mastery, 3),
+                "created_at": summary.created_at.isoformat(),
+                "completed_at": (
+                    summary.completed_at.isoformat()
+                    if summary.completed_at else None
+                ),
+                "session_count": summary.session_count,
+                "incomplete_sessions": [
+                    {
+                        "session_id": session.session_id,
+                        "questions_answered": session.questions_answered,
+                        "total_questions": session.total_questions,
+                        "max_questions": session.max_questions,
+                        "started_at": session.started_at.isoformat(),
+                    }
+                    for session in summary.incomplete_sessions
+                ],
+            }
+            for summary in summaries
+        ]
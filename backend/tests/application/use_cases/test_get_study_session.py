@@ -8,7 +8,10 @@ from application.common.exceptions import (
     StudySessionNotFoundException,
 )
 from application.use_cases.get_study_session import GetStudySessionViewUseCase
-from application.dto.study_session_view import StudySessionView
+from application.dto.study_session_view import (
+    StudySessionView,
+    StudySessionProgressView,
+)
 from application.services.study_session_view import StudySessionViewService
 from domain.entities.learning import LearningPlan, StudySession
 from domain.entities.question import QuestionID, SessionQuestion
@@ -138,3 +141,84 @@ class TestGetStudySessionViewUseCase:
                 learning_plan_id=sample_learning_plan.id,
                 study_session_id="non-existent-session-id",
             )
+
+    @staticmethod
+    def test_execute_progress_returns_progress_view(
+        sample_learning_plan: LearningPlan,
+        sample_study_session: StudySession,
+        learning_plan_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should return a StudySessionProgressView for the requested session."""
+        # Arrange
+        learning_plan_repository.save(sample_learning_plan)
+
+        mock_view_service = Mock(spec=StudySessionViewService)
+        expected_view = StudySessionProgressView(
+            id=sample_study_session.id,
+            progress=0.0,
+            questions=[],
+            is_completed=False,
+        )
+        mock_view_service.build_progress_view.return_value = expected_view
+
+        use_case = GetStudySessionViewUseCase(
+            learning_plan_repo=learning_plan_repository,
+            view_service=mock_view_service,
+        )
+
+        # Act
+        result = use_case.execute_progress(
+            learning_plan_id=sample_learning_plan.id,
+            study_session_id=sample_study_session.id,
+        )
+
+        # Assert
+        assert isinstance(result, StudySessionProgressView)
+        assert result.id == sample_study_session.id
+        mock_view_service.build_progress_view.assert_called_once_with(
+            sample_study_session
+        )
+        mock_view_service.build_view.assert_not_called()
+
+    @staticmethod
+    def test_execute_progress_raises_when_learning_plan_not_found(
+        learning_plan_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should raise LearningPlanNotFoundException for an unknown plan."""
+        # Arrange
+        mock_view_service = Mock(spec=StudySessionViewService)
+
+        use_case = GetStudySessionViewUseCase(
+            learning_plan_repo=learning_plan_repository,
+            view_service=mock_view_service,
+        )
+
+        # Act & Assert
+        with pytest.raises(LearningPlanNotFoundException):
+            use_case.execute_progress(
+                learning_plan_id="non-existent-id",
+                study_session_id="session-id",
+            )
+
+    @staticmethod
+    def test_execute_progress_raises_when_study_session_not_found(
+        sample_learning_plan: LearningPlan,
+        learning_plan_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should raise StudySessionNotFoundException for an unknown session."""
+        # Arrange
+        learning_plan_repository.save(sample_learning_plan)
+
+        mock_view_service = Mock(spec=StudySessionViewService)
+
+        use_case = GetStudySessionViewUseCase(
+            learning_plan_repo=learning_plan_repository,
+            view_service=mock_view_service,
+        )
+
+        # Act & Assert
+        with pytest.raises(StudySessionNotFoundException):
+            use_case.execute_progress(
+                learning_plan_id=sample_learning_plan.id,
+                study_session_id="non-existent-session-id",
+            )
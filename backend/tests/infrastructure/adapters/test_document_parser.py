@@ -136,6 +136,57 @@ class TestLLMOCRDocumentParser:
         assert document.metadata['num_pages'] == 1
         assert document.metadata['parser'] == "llm_ocr_batched"
 
+    @staticmethod
+    def test_parse_uses_text_layer_without_calling_vision(parser, mock_openai_client, monkeypatch):
+        """Test that pages with a real text layer never reach the vision API."""
+        # Mock a digitally generated page with an embedded text layer
+        native_text = "Python is a high-level programming language. " * 5
+        mock_page = Mock()
+        mock_page.get_text.return_value = native_text
+
+        mock_doc = Mock()
+        mock_doc.__iter__ = Mock(return_value=iter([mock_page]))
+        mock_doc.close = Mock()
+
+        monkeypatch.setattr('pymupdf.open', Mock(return_value=mock_doc))
+
+        # Parse a "PDF"
+        document = parser.parse(b"fake pdf bytes", "native.pdf")
+
+        # The text layer is used verbatim and no page is rendered or OCRed
+        assert document.text == native_text.strip()
+        assert document.metadata['parser'] == "native"
+        mock_page.get_pixmap.assert_not_called()
+        mock_openai_client.chat.completions.create.assert_not_called()
+
+    @staticmethod
+    def test_parse_short_text_layer_falls_through_to_ocr(parser, mock_openai_client, monkeypatch):
+        """Test that a suspiciously short text layer still triggers OCR."""
+        # Stray artifacts on a scanned page: below min_native_chars
+        mock_page = Mock()
+        mock_page.get_text.return_value = "p. 1"
+
+        mock_pixmap = Mock()
+        mock_pixmap.width = 100
+        mock_pixmap.height = 100
+        mock_pixmap.samples = b"\x80" * (100 * 100)
+        mock_page.get_pixmap.return_value = mock_pixmap
+
+        mock_doc = Mock()
+        mock_doc.__iter__ = Mock(return_value=iter([mock_page]))
+        mock_doc.close = Mock()
+
+        monkeypatch.setattr('pymupdf.open', Mock(return_value=mock_doc))
+
+        # Parse a "PDF"
+        document = parser.parse(b"fake pdf bytes", "scanned.pdf")
+
+        # The short extraction is discarded in favor of the OCR result
+        assert document.text == "Extracted text from page"
+        assert document.metadata['parser'] == "llm_ocr_batched"
+        mock_page.get_pixmap.assert_called_once()
+        mock_openai_client.chat.completions.create.assert_called_once()
+
 
 @pytest.mark.integration
 class TestLLMOCRDocumentParserIntegration:
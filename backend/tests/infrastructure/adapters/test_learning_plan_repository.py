@@ -0,0 +1,187 @@
+"""Tests for the identity-map learning plan repository decorator."""
+import uuid
+from datetime import datetime, UTC
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.learning import LearningPlan, LearningPlanID
+from domain.ports.learning_plan_repository import LearningPlanRepository
+from infrastructure.adapters.learning_plan_repository import (
+    IdentityMapLearningPlanRepository,
+    InMemoryLearningPlanRepository,
+)
+
+
+def make_plan() -> LearningPlan:
+    """Build an empty LearningPlan with a fresh ID."""
+    return LearningPlan(
+        id=LearningPlanID(str(uuid.uuid4())),
+        knowledge_units=[],
+        created_at=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def inner_repository() -> InMemoryLearningPlanRepository:
+    """Provide an in-memory repository to decorate."""
+    return InMemoryLearningPlanRepository(_plans={})
+
+
+class TestIdentityMapLearningPlanRepository:
+    """Test suite for IdentityMapLearningPlanRepository."""
+
+    @staticmethod
+    def test_get_by_id_hydrates_the_plan_only_once(
+        inner_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should serve repeated fetches of a plan from the identity map."""
+        # Arrange
+        plan = make_plan()
+        inner_repository.save(plan)
+        spy = Mock(wraps=inner_repository, spec=LearningPlanRepository)
+        repository = IdentityMapLearningPlanRepository(_inner=spy)
+
+        # Act
+        first = repository.get_by_id(plan.id)
+        second = repository.get_by_id(plan.id)
+
+        # Assert
+        assert first is plan
+        assert second is plan
+        spy.get_by_id.assert_called_once_with(plan.id)
+
+    @staticmethod
+    def test_get_by_id_miss_is_not_cached(
+        inner_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should return None for unknown plans without caching the miss."""
+        # Arrange
+        spy = Mock(wraps=inner_repository, spec=LearningPlanRepository)
+        repository = IdentityMapLearningPlanRepository(_inner=spy)
+
+        # Act
+        first = repository.get_by_id("missing-id")
+        second = repository.get_by_id("missing-id")
+
+        # Assert
+        assert first is None
+        assert second is None
+        assert spy.get_by_id.call_count == 2
+
+    @staticmethod
+    def test_save_writes_through_and_refreshes_the_map(
+        inner_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should persist via the decoratee and serve the saved instance back."""
+        # Arrange
+        plan = make_plan()
+        spy = Mock(wraps=inner_repository, spec=LearningPlanRepository)
+        repository = IdentityMapLearningPlanRepository(_inner=spy)
+
+        # Act
+        repository.save(plan)
+        result = repository.get_by_id(plan.id)
+
+        # Assert
+        assert result is plan
+        spy.save.assert_called_once_with(plan)
+        spy.get_by_id.assert_not_called()
+        assert inner_repository.get_by_id(plan.id) is plan
+
+    @staticmethod
+    def test_get_session_served_from_cached_plan(
+        inner_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should resolve sessions from the cached aggregate when present."""
+        # Arrange
+        plan = make_plan()
+        session = plan.start_session(max_questions=5)
+        inner_repository.save(plan)
+        spy = Mock(wraps=inner_repository, spec=LearningPlanRepository)
+        repository = IdentityMapLearningPlanRepository(_inner=spy)
+        repository.get_by_id(plan.id)  # warm the map
+
+        # Act
+        result = repository.get_session(plan.id, session.id)
+
+        # Assert
+        assert result is session
+        spy.get_session.assert_not_called()
+
+    @staticmethod
+    def test_get_session_falls_back_to_inner_repo(
+        inner_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should delegate session lookups for plans not yet in the map."""
+        # Arrange
+        plan = make_plan()
+        session = plan.start_session(max_questions=5)
+        inner_repository.save(plan)
+        spy = Mock(wraps=inner_repository, spec=LearningPlanRepository)
+        repository = IdentityMapLearningPlanRepository(_inner=spy)
+
+        # Act
+        result = repository.get_session(plan.id, session.id)
+
+        # Assert
+        assert result is session
+        spy.get_session.assert_called_once_with(plan.id, session.id)
+
+    @staticmethod
+    def test_submit_answer_delegates_to_inner_repo(
+        inner_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should pass the specialized answer write straight through."""
+        # Arrange
+        spy = Mock(wraps=inner_repository, spec=LearningPlanRepository)
+        repository = IdentityMapLearningPlanRepository(_inner=spy)
+
+        # Act
+        result = repository.submit_answer(
+            "plan-id", "session-id", "question-id", "an answer"
+        )
+
+        # Assert
+        assert result is False  # unknown plan in the decoratee
+        spy.submit_answer.assert_called_once_with(
+            "plan-id", "session-id", "question-id", "an answer"
+        )
+
+    @staticmethod
+    def test_list_active_delegates_with_page_window(
+        inner_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should delegate listing, forwarding limit and offset untouched."""
+        # Arrange
+        plans = [make_plan() for _ in range(3)]
+        for plan in plans:
+            inner_repository.save(plan)
+        spy = Mock(wraps=inner_repository, spec=LearningPlanRepository)
+        repository = IdentityMapLearningPlanRepository(_inner=spy)
+
+        # Act
+        result = repository.list_active(limit=2, offset=1)
+
+        # Assert
+        assert result == plans[1:3]
+        spy.list_active.assert_called_once_with(limit=2, offset=1)
+
+    @staticmethod
+    def test_delete_drops_the_plan_from_the_map(
+        inner_repository: InMemoryLearningPlanRepository,
+    ) -> None:
+        """Should evict a deleted plan so later fetches miss honestly."""
+        # Arrange
+        plan = make_plan()
+        inner_repository.save(plan)
+        spy = Mock(wraps=inner_repository, spec=LearningPlanRepository)
+        repository = IdentityMapLearningPlanRepository(_inner=spy)
+        repository.get_by_id(plan.id)  # warm the map
+
+        # Act
+        repository.delete(plan.id)
+
+        # Assert
+        spy.delete.assert_called_once_with(plan.id)
+        assert repository.get_by_id(plan.id) is None
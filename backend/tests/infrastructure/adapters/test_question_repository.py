@@ -0,0 +1,222 @@
+"""Tests for the caching question repository decorator."""
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.question import Answer, Difficulty, Question, QuestionID
+from domain.ports.question_repository import QuestionRepository
+from infrastructure.adapters.question_repository import (
+    CachingQuestionRepository,
+    InMemoryQuestionRepository,
+)
+
+
+def make_question(text: str = "What is Python?") -> Question:
+    """Build a Question with a fresh ID."""
+    return Question(
+        id=QuestionID(str(uuid.uuid4())),
+        text=text,
+        difficulty=Difficulty(level=2),
+        correct_answer=Answer("Python is a high-level programming language"),
+        knowledge_unit_id="ku-1",
+    )
+
+
+@pytest.fixture
+def inner_repository() -> InMemoryQuestionRepository:
+    """Provide an in-memory repository to decorate."""
+    return InMemoryQuestionRepository(_questions={})
+
+
+class TestCachingQuestionRepository:
+    """Test suite for CachingQuestionRepository."""
+
+    @staticmethod
+    def test_get_by_id_hits_inner_repo_only_once(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should serve repeated lookups from the cache without re-querying."""
+        # Arrange
+        question = make_question()
+        inner_repository.save(question)
+        spy = Mock(wraps=inner_repository, spec=QuestionRepository)
+        repository = CachingQuestionRepository(_inner=spy)
+
+        # Act
+        first = repository.get_by_id(question.id)
+        second = repository.get_by_id(question.id)
+
+        # Assert
+        assert first is question
+        assert second is question
+        spy.get_by_id.assert_called_once_with(question.id)
+
+    @staticmethod
+    def test_get_by_id_miss_is_not_cached(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should return None for unknown IDs and keep asking the store."""
+        # Arrange
+        spy = Mock(wraps=inner_repository, spec=QuestionRepository)
+        repository = CachingQuestionRepository(_inner=spy)
+
+        # Act
+        first = repository.get_by_id("missing-id")
+        second = repository.get_by_id("missing-id")
+
+        # Assert
+        assert first is None
+        assert second is None
+        assert spy.get_by_id.call_count == 2
+
+    @staticmethod
+    def test_get_many_fetches_only_cache_misses(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should merge cached instances with an inner fetch of the misses."""
+        # Arrange
+        cached_question = make_question("Cached question?")
+        fetched_question = make_question("Fetched question?")
+        inner_repository.save_many([cached_question, fetched_question])
+        spy = Mock(wraps=inner_repository, spec=QuestionRepository)
+        repository = CachingQuestionRepository(_inner=spy)
+        repository.get_by_id(cached_question.id)  # warm the cache
+
+        # Act
+        result = repository.get_many(
+            [cached_question.id, fetched_question.id, "missing-id"]
+        )
+
+        # Assert
+        assert result == {
+            cached_question.id: cached_question,
+            fetched_question.id: fetched_question,
+        }
+        spy.get_many.assert_called_once_with([fetched_question.id, "missing-id"])
+
+    @staticmethod
+    def test_get_many_skips_inner_repo_when_all_cached(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should not touch the underlying store when every ID is cached."""
+        # Arrange
+        questions = [make_question(f"Question {i}?") for i in range(3)]
+        inner_repository.save_many(questions)
+        spy = Mock(wraps=inner_repository, spec=QuestionRepository)
+        repository = CachingQuestionRepository(_inner=spy)
+        repository.get_many([question.id for question in questions])
+        spy.get_many.reset_mock()
+
+        # Act
+        result = repository.get_many([question.id for question in questions])
+
+        # Assert
+        assert len(result) == 3
+        spy.get_many.assert_not_called()
+
+    @staticmethod
+    def test_save_writes_through_and_refreshes_cache(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should keep the cached instance coherent with the store on save."""
+        # Arrange
+        question = make_question()
+        inner_repository.save(question)
+        repository = CachingQuestionRepository(_inner=inner_repository)
+        repository.get_by_id(question.id)  # warm the cache
+
+        updated = Question(
+            id=question.id,
+            text="Updated question?",
+            difficulty=question.difficulty,
+            correct_answer=question.correct_answer,
+            knowledge_unit_id=question.knowledge_unit_id,
+        )
+
+        # Act
+        repository.save(updated)
+
+        # Assert
+        assert repository.get_by_id(question.id) is updated
+        assert inner_repository.get_by_id(question.id) is updated
+
+    @staticmethod
+    def test_save_many_writes_through_to_inner_repo(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should persist a batch and serve it back from the cache."""
+        # Arrange
+        questions = [make_question(f"Question {i}?") for i in range(3)]
+        spy = Mock(wraps=inner_repository, spec=QuestionRepository)
+        repository = CachingQuestionRepository(_inner=spy)
+
+        # Act
+        repository.save_many(questions)
+        result = repository.get_many([question.id for question in questions])
+
+        # Assert
+        assert len(result) == 3
+        spy.save_many.assert_called_once_with(questions)
+        spy.get_many.assert_not_called()
+
+    @staticmethod
+    def test_evicts_oldest_entry_when_full(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should evict the oldest cached entry once max_size is reached."""
+        # Arrange
+        questions = [make_question(f"Question {i}?") for i in range(3)]
+        inner_repository.save_many(questions)
+        spy = Mock(wraps=inner_repository, spec=QuestionRepository)
+        repository = CachingQuestionRepository(_inner=spy, max_size=2)
+        for question in questions:
+            repository.get_by_id(question.id)
+
+        # Assert: the first-admitted entry was evicted, the rest remain
+        assert questions[0].id not in repository._cache
+        assert questions[1].id in repository._cache
+        assert questions[2].id in repository._cache
+        assert len(repository._cache) == 2
+
+        # Act: re-fetching the evicted entry goes back to the store
+        spy.get_by_id.reset_mock()
+        repository.get_by_id(questions[0].id)
+        spy.get_by_id.assert_called_once_with(questions[0].id)
+
+    @staticmethod
+    def test_readmitting_cached_entry_does_not_evict(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should not evict when a save refreshes an already-cached entry."""
+        # Arrange
+        questions = [make_question(f"Question {i}?") for i in range(2)]
+        repository = CachingQuestionRepository(
+            _inner=inner_repository, max_size=2
+        )
+        repository.save_many(questions)
+
+        # Act: re-save an entry that is already cached at capacity
+        repository.save(questions[1])
+
+        # Assert
+        assert questions[0].id in repository._cache
+        assert questions[1].id in repository._cache
+
+    @staticmethod
+    def test_list_all_delegates_to_inner_repo(
+        inner_repository: InMemoryQuestionRepository,
+    ) -> None:
+        """Should list from the underlying store, not the cache."""
+        # Arrange
+        questions = [make_question(f"Question {i}?") for i in range(3)]
+        inner_repository.save_many(questions)
+        repository = CachingQuestionRepository(
+            _inner=inner_repository, max_size=1
+        )
+
+        # Act
+        result = repository.list_all()
+
+        # Assert
+        assert len(result) == 3
@@ -287,6 +287,20 @@ class TestCompleteLearningFlow:
         assert len(session_view["questions"]) > 0
         assert session_view["progress"] == 0.0  # No questions answered yet
 
+        # Step 3b: Get the lightweight progress view
+        response = app_client.get(
+            f"/learning-plans/{learning_plan_id}/sessions/{session_id}/progress",
+        )
+        assert response.status_code == 200
+        progress_view = response.json()
+        assert progress_view["id"] == session_id
+        assert progress_view["progress"] == 0.0
+        assert progress_view["is_completed"] is False
+        assert len(progress_view["questions"]) == len(session_view["questions"])
+        for question_entry in progress_view["questions"]:
+            # Progress polling must not ship question payloads
+            assert set(question_entry) == {"id", "status", "attempts"}
+
         # Get a question to answer
         question_id = session_view["questions"][0]["id"]
 